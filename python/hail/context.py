@@ -104,6 +104,8 @@ class HailContext(object):
         Env._jvm = None
         Env._gateway = None
         Env._hc = None
+        Env._jnone = None
+        Env._jempty_set = None
         uninstall_exception_handler()
         Env._dummy_table = None
 
@@ -205,8 +207,7 @@ def get_reference(name):
 
     if name == 'default':
         return default_reference()
+    elif name in ReferenceGenome._references:
+        return ReferenceGenome._references[name]
     else:
-        return ReferenceGenome._references.get(
-            name,
-            ReferenceGenome._from_java(Env.hail().variant.ReferenceGenome.getReference(name))
-        )
+        return ReferenceGenome._from_java(Env.hail().variant.ReferenceGenome.getReference(name))
@@ -1,4 +1,5 @@
 import abc
+import functools
 from typing import *
 
 import hail as hl
@@ -423,6 +424,7 @@ primitives: Dict[HailType, ExprCoercer] = {
 }
 
 
+@functools.lru_cache(maxsize=1024)
 def coercer_from_dtype(t: HailType) -> ExprCoercer:
     if t in primitives:
         return primitives[t]
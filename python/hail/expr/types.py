@@ -1,4 +1,5 @@
 import abc
+import functools
 import json
 from collections import Mapping
 
@@ -38,6 +39,8 @@ __all__ = [
 ]
 
 
+# types are immutable, so repeated parses of the same string can share one instance
+@functools.lru_cache(maxsize=1024)
 def dtype(type_str):
     r"""Parse a type from its string representation.
 
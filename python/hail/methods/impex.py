@@ -1,5 +1,5 @@
 from hail.typecheck import *
-from hail.utils.java import Env, joption, FatalError, jindexed_seq_args, jset_args
+from hail.utils.java import Env, joption, jsome, FatalError, jindexed_seq_args, jset_args, jstr_map
 from hail.utils import wrap_to_list
 from hail.utils.misc import plural
 from hail.matrixtable import MatrixTable
@@ -88,11 +88,71 @@ def export_gen(dataset, output, precision=4):
     except KeyError:
         raise FatalError("export_gen: no entry field 'GP' of type 'array<float64>'")
 
-    dataset = require_biallelic(dataset, 'export_plink')
-
     Env.hail().io.gen.ExportGen.apply(dataset._jvds, output, precision)
 
 
+@typecheck(dataset=MatrixTable,
+           output=str,
+           compression=enumeration('snappy', 'gzip', 'none'),
+           partition_cols=oneof(str, listof(str)),
+           overwrite=bool)
+def export_parquet(dataset, output, compression='snappy', partition_cols='locus.contig', overwrite=False):
+    """Export a :class:`.MatrixTable` as a Parquet dataset.
+
+    .. include:: ../_templates/req_tvariant.rst
+
+    Examples
+    --------
+    Export to Parquet, partitioned into one directory per contig:
+
+    >>> hl.export_parquet(dataset, 'output/example.parquet')
+
+    Notes
+    -----
+    Each row of the dataset becomes one Parquet record. Row fields are
+    flattened into top-level columns (for example, `locus` is written as
+    ``locus.contig`` and ``locus.position``), and the entries of the row are
+    written as a single nested column `entries` of type
+    ``array<struct>``, in column order. Column and global fields are not
+    exported.
+
+    Because Parquet is a columnar format, downstream queries that read only a
+    few fields (such as a single INFO field) do not need to scan the others.
+
+    The `partition_cols` fields are encoded in the output directory names
+    (for example, ``locus.contig=20/``) and are not stored in the data files
+    themselves. Spark's Parquet reader restores them as columns when reading
+    the whole directory.
+
+    Exporting to a path that already exists is an error unless `overwrite`
+    is ``True``, in which case the existing output is deleted first.
+
+    Parameters
+    ----------
+    dataset : :class:`.MatrixTable`
+        Dataset.
+    output : :obj:`str`
+        Path of the Parquet directory to write.
+    compression : :obj:`str`
+        Parquet compression codec: ``'snappy'``, ``'gzip'``, or ``'none'``.
+    partition_cols : :obj:`str` or :obj:`list` of :obj:`str`
+        Flattened row field names by which to partition the output directories.
+    overwrite : :obj:`bool`
+        If ``True``, replace any existing output at `output`.
+    """
+
+    require_row_key_variant(dataset, 'export_parquet')
+    if 'entries' in dataset.row.dtype:
+        raise FatalError("export_parquet: row field 'entries' conflicts with the exported entries column")
+
+    df = Table(dataset._jvds.localizeEntries('entries')).to_spark(expand=True, flatten=True)
+    df.write.parquet(output, mode='overwrite' if overwrite else 'error', partitionBy=wrap_to_list(partition_cols), compression=compression)
+
+
+_fam_dict = {'fam_id': tstr, 'id': tstr, 'mat_id': tstr, 'pat_id': tstr,
+             'is_female': tbool, 'is_case': tbool, 'quant_pheno': tfloat64}
+
+
 @typecheck(dataset=MatrixTable,
            output=str,
            fam_args=expr_any)
@@ -160,25 +220,29 @@ def export_plink(dataset, output, **fam_args):
         Named expressions defining FAM field values.
     """
 
-    fam_dict = {'fam_id': tstr, 'id': tstr, 'mat_id': tstr, 'pat_id': tstr,
-                'is_female': tbool, 'is_case': tbool, 'quant_pheno': tfloat64}
+    named_exprs = fam_args
+    _validate_fam_args(dataset, named_exprs)
+
+    base, _ = dataset._process_joins(*named_exprs.values())
+    base = require_biallelic(base, 'export_plink')
 
-    exprs = []
-    named_exprs = {k: v for k, v in fam_args.items()}
+    Env.hail().io.plink.ExportPlink.apply(base._jvds, output, _render_fam_exprs(named_exprs))
+
+
+def _validate_fam_args(dataset, named_exprs):
     if ('is_case' in named_exprs) and ('quant_pheno' in named_exprs):
         raise ValueError("At most one of 'is_case' and 'quant_pheno' may be given as fam_args. Found both.")
     for k, v in named_exprs.items():
-        if k not in fam_dict:
-            raise ValueError("fam_arg '{}' not recognized. Valid names: {}".format(k, ', '.join(fam_dict)))
-        elif (v.dtype != fam_dict[k]):
-            raise TypeError("fam_arg '{}' expression has type {}, expected type {}".format(k, v.dtype, fam_dict[k]))
+        if k not in _fam_dict:
+            raise ValueError("fam_arg '{}' not recognized. Valid names: {}".format(k, ', '.join(_fam_dict)))
+        elif v.dtype is not _fam_dict[k]:
+            raise TypeError("fam_arg '{}' expression has type {}, expected type {}".format(k, v.dtype, _fam_dict[k]))
 
         analyze('export_plink/{}'.format(k), v, dataset._col_indices)
-        exprs.append('`{k}` = {v}'.format(k=k, v=v._ast.to_hql()))
-    base, _ = dataset._process_joins(*named_exprs.values())
-    base = require_biallelic(base, 'export_plink')
 
-    Env.hail().io.plink.ExportPlink.apply(base._jvds, output, ','.join(exprs))
+
+def _render_fam_exprs(named_exprs):
+    return ','.join('`{k}` = {v}'.format(k=k, v=v._ast.to_hql()) for k, v in named_exprs.items())
 
 
 @typecheck(table=Table,
@@ -375,9 +439,10 @@ def import_locus_intervals(path, reference_genome='default'):
     :class:`.Table`
         Interval-keyed table.
     """
-    rg = reference_genome._jrep if reference_genome else None
-
-    t = Env.hail().table.Table.importIntervalList(Env.hc()._jhc, path, joption(rg))
+    if reference_genome:
+        t = Env.hail().table.Table.importIntervalList(Env.hc()._jhc, path, jsome(reference_genome._jrep))
+    else:
+        t = Env.hail().table.Table.importIntervalList(Env.hc()._jhc, path)
     return Table(t)
 
 
@@ -465,9 +530,10 @@ def import_bed(path, reference_genome='default'):
     # >>> bed = hl.import_bed('data/file2.bed')
     # >>> vds_result = vds.annotate_rows(cnvID = bed[vds.locus])
 
-    rg = reference_genome._jrep if reference_genome else None
-
-    jt = Env.hail().table.Table.importBED(Env.hc()._jhc, path, joption(rg))
+    if reference_genome:
+        jt = Env.hail().table.Table.importBED(Env.hc()._jhc, path, jsome(reference_genome._jrep))
+    else:
+        jt = Env.hail().table.Table.importBED(Env.hc()._jhc, path)
     return Table(jt)
 
 
@@ -575,6 +641,9 @@ def grep(regex, path, max_count=100):
     Env.hc()._jhc.grep(regex, jindexed_seq_args(path), max_count)
 
 
+_bgen_entry_fields = frozenset(('GT', 'GP', 'dosage'))
+
+
 @typecheck(path=oneof(str, listof(str)),
            sample_file=nullable(str),
            entry_fields=listof(str),
@@ -691,14 +760,11 @@ def import_bgen(path, entry_fields, sample_file=None,
     :class:`.MatrixTable`
     """
 
-    rg = reference_genome._jrep if reference_genome else None
-
     if not entry_fields:
         raise FatalError("import_bgen: entry_fields must be non-empty."
                          "\n    Options: 'GT', 'GP', 'dosage'.")
 
-    entry_set = set(entry_fields)
-    bad_entry_fields = list(entry_set - {'GT', 'GP', 'dosage'})
+    bad_entry_fields = [f for f in entry_fields if f not in _bgen_entry_fields]
 
     if bad_entry_fields:
         word = plural('value', len(bad_entry_fields))
@@ -706,11 +772,15 @@ def import_bgen(path, entry_fields, sample_file=None,
                          "\n    Options: 'GT', 'GP', 'dosage'.".format(word, bad_entry_fields))
 
     if contig_recoding:
-        contig_recoding = tdict(tstr, tstr)._convert_to_j(contig_recoding)
+        contig_recoding = jstr_map(contig_recoding)
 
-    jmt = Env.hc()._jhc.importBgens(jindexed_seq_args(path), joption(sample_file),
-                                    'GT' in entry_set, 'GP' in entry_set, 'dosage' in entry_set,
-                                    joption(min_partitions), joption(rg), joption(contig_recoding), tolerance)
+    jargs = [jindexed_seq_args(path), joption(sample_file),
+             'GT' in entry_fields, 'GP' in entry_fields, 'dosage' in entry_fields,
+             joption(min_partitions)]
+    if reference_genome:
+        jargs.append(jsome(reference_genome._jrep))
+
+    jmt = Env.hc()._jhc.importBgens(*jargs, joption(contig_recoding), tolerance)
     return MatrixTable(jmt)
 
 
@@ -720,9 +790,10 @@ def import_bgen(path, entry_fields, sample_file=None,
            min_partitions=nullable(int),
            chromosome=nullable(str),
            reference_genome=nullable(reference_genome_type),
-           contig_recoding=nullable(dictof(str, str)))
+           contig_recoding=nullable(dictof(str, str)),
+           force_bgz=bool)
 def import_gen(path, sample_file=None, tolerance=0.2, min_partitions=None, chromosome=None,
-               reference_genome='default', contig_recoding=None):
+               reference_genome='default', contig_recoding=None, force_bgz=False):
     """
     Import GEN file(s) as a :class:`.MatrixTable`.
 
@@ -798,19 +869,24 @@ def import_gen(path, sample_file=None, tolerance=0.2, min_partitions=None, chrom
     contig_recoding : :obj:`dict` of :obj:`str` to :obj:`str`, optional
         Dict of old contig name to new contig name. The new contig name must be
         in the reference genome given by `reference_genome`.
+    force_bgz : :obj:`bool`
+        If ``True``, load **.gz** files as blocked gzip files, assuming
+        that they were actually compressed using the BGZ codec. Otherwise,
+        **.gz** files are decompressed serially, one partition per file.
 
     Returns
     -------
     :class:`.MatrixTable`
     """
 
-    rg = reference_genome._jrep if reference_genome else None
-
     if contig_recoding:
-        contig_recoding = tdict(tstr, tstr)._convert_to_j(contig_recoding)
+        contig_recoding = jstr_map(contig_recoding)
+
+    jargs = [jindexed_seq_args(path), sample_file, joption(chromosome), joption(min_partitions), tolerance]
+    if reference_genome:
+        jargs.append(jsome(reference_genome._jrep))
 
-    jmt = Env.hc()._jhc.importGens(jindexed_seq_args(path), sample_file, joption(chromosome), joption(min_partitions),
-                                   tolerance, joption(rg), joption(contig_recoding))
+    jmt = Env.hc()._jhc.importGens(*jargs, joption(contig_recoding), force_bgz)
     return MatrixTable(jmt)
 
 
@@ -1280,8 +1356,7 @@ def import_plink(bed, bim, fam,
     rg = reference_genome._jrep if reference_genome else None
 
     if contig_recoding:
-        contig_recoding = tdict(tstr,
-                                tstr)._convert_to_j(contig_recoding)
+        contig_recoding = jstr_map(contig_recoding)
 
     jmt = Env.hc()._jhc.importPlink(bed, bim, fam, joption(min_partitions),
                                     delimiter, missing, quant_pheno,
@@ -1493,7 +1568,7 @@ def import_vcf(path, force=False, force_bgz=False, header_file=None, min_partiti
     rg = reference_genome._jrep if reference_genome else None
 
     if contig_recoding:
-        contig_recoding = tdict(tstr, tstr)._convert_to_j(contig_recoding)
+        contig_recoding = jstr_map(contig_recoding)
 
     jmt = Env.hc()._jhc.importVCFs(jindexed_seq_args(path), force, force_bgz, joption(header_file),
                                    joption(min_partitions), drop_samples, jset_args(call_fields),
@@ -1,16 +1,44 @@
+import functools
+import operator
 import unittest
 
 import hail as hl
 import hail.expr.aggregators as agg
 from hail.expr import dtype, coercer_from_dtype
 from hail.expr.types import *
-from .utils import startTestHailContext, stopTestHailContext
+from .utils import startTestHailContext
+
+
+def setUpModule():
+    # the context is left running for later test modules and stopped at exit
+    startTestHailContext()
+    # run the first Spark job and expression compilation up front rather than inside the first test
+    hl.eval_expr(hl.literal(0) + 1)
+
+
+# numeric element types, narrowest first
+_numeric_types = [tint32, tint64, tfloat32, tfloat64]
+
+
+@functools.lru_cache(maxsize=None, typed=True)
+def _lit(value, t=None):
+    # scalar constants shared across tests (operands, booleans); expressions are immutable, so each is built once
+    # per module, and typed keeps True and 1 apart. One-off strings, lists and tuples use hl.literal directly.
+    return hl.literal(value, t)
+
+
+def _typed_array(values, t):
+    # an array of constants of type t, rather than a conversion mapped over an int32 array
+    return hl.array([hl.null(t) if v is None else _lit(v, t) for v in values])
 
-setUpModule = startTestHailContext
-tearDownModule = stopTestHailContext
 
 class TypeTests(unittest.TestCase):
-    def types_to_test(self):
+    @classmethod
+    def setUpClass(cls):
+        cls._cached_types = cls._build_types()
+
+    @staticmethod
+    def _build_types():
         return [
             tint32,
             tint64,
@@ -40,6 +68,9 @@ class TypeTests(unittest.TestCase):
             ttuple(tarray(tint32), tstr, tstr, tint32, tbool),
             ttuple()]
 
+    def types_to_test(self):
+        return self._cached_types
+
     def test_parser_roundtrip(self):
         for t in self.types_to_test():
             self.assertEqual(t, dtype(str(t)))
@@ -50,20 +81,29 @@ class TypeTests(unittest.TestCase):
 
     def test_equality(self):
         ts = self.types_to_test()
-        ts2 = self.types_to_test()  # reallocates the non-primitive types
+        ts2 = self._build_types()  # reallocates the non-primitive types
+
+        # distinct types must not collapse in a set, and each reallocated type must collapse onto its original
+        self.assertEqual(len(set(ts)), len(ts))
+        self.assertEqual(len(set(ts + ts2)), len(ts))
+        for t, t2 in zip(ts, ts2):
+            self.assertEqual(t, t2)
+            self.assertEqual(hash(t), hash(t2))
 
+        # distinct types hash apart, so the set checks never compare them; check _eq on every unequal pair directly
         for i in range(len(ts)):
             for j in range(len(ts2)):
-                if (i == j):
-                    self.assertEqual(ts[i], ts2[j])
-                else:
+                if i != j:
                     self.assertNotEqual(ts[i], ts2[j])
 
     def test_jvm_roundtrip(self):
         ts = self.types_to_test()
-        for t in ts:
-            rev_str = t._jtype.toString()
-            self.assertEqual(t, dtype(rev_str))
+        # round trip every type through one JVM tuple type, so the JVM renders them all in a single call
+        rev_str = ttuple(*ts)._jtype.toString()
+        rev_ts = dtype(rev_str).types
+        self.assertEqual(len(ts), len(rev_ts))
+        for t, rev_t in zip(ts, rev_ts):
+            self.assertEqual(t, rev_t)
 
     def test_pretty_roundtrip(self):
         ts = self.types_to_test()
@@ -82,6 +122,39 @@ class TypeTests(unittest.TestCase):
 
 
 class Tests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # operands shared by the arithmetic tests
+        cls.a_int32 = hl.array([2, 4, 8, 16, hl.null(tint32)])
+        cls.a_int64 = _typed_array([2, 4, 8, 16, None], tint64)
+        cls.a_float32 = _typed_array([2, 4, 8, 16, None], tfloat32)
+        cls.a_float64 = _typed_array([2, 4, 8, 16, None], tfloat64)
+        cls.int32_3s = hl.array([3, 3, 3, 3, hl.null(tint32)])
+        cls.int64_3 = _lit(3, tint64)
+        cls.int64_3s = _typed_array([3, 3, 3, 3, None], tint64)
+        cls.float32_3 = _lit(3, tfloat32)
+        cls.float32_3s = _typed_array([3, 3, 3, 3, None], tfloat32)
+        cls.float64_3 = _lit(3, tfloat64)
+        cls.float64_3s = _typed_array([3, 3, 3, 3, None], tfloat64)
+
+        cls.range10 = hl.utils.range_table(10)
+        df = cls.range10
+        cls.bools10 = df.annotate(all_true=True,
+                                  all_false=False,
+                                  true_or_missing=hl.cond(df.idx % 2 == 0, True, hl.null(tbool)),
+                                  false_or_missing=hl.cond(df.idx % 2 == 0, False, hl.null(tbool)),
+                                  all_missing=hl.null(tbool),
+                                  mixed_true_false=hl.cond(df.idx % 2 == 0, True, False),
+                                  mixed_all=hl.switch(df.idx % 3)
+                                  .when(0, True)
+                                  .when(1, False)
+                                  .or_missing()).cache()
+        cls.bools10.count()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.bools10.unpersist()
+
     def test_floating_point(self):
         self.assertEqual(hl.eval_expr(1.1e-15), 1.1e-15)
 
@@ -92,15 +165,14 @@ class Tests(unittest.TestCase):
         self.assertFalse(hl.eval_expr(string.matches(r'\\d+')))
 
     def test_cond(self):
-        self.assertEqual(hl.eval_expr('A' + hl.cond(True, 'A', 'B')), 'AA')
-
-        self.assertEqual(hl.cond(True, hl.struct(), hl.null(hl.tstruct())).value, hl.utils.Struct())
-
-        self.assertEqual(hl.cond(hl.null(hl.tbool), 1, 2).value, None)
-        self.assertEqual(hl.cond(hl.null(hl.tbool), 1, 2, missing_false=True).value, 2)
+        self.check_values([
+            ('A' + hl.cond(True, 'A', 'B'), 'AA'),
+            (hl.cond(True, hl.struct(), hl.null(hl.tstruct())), hl.utils.Struct()),
+            (hl.cond(hl.null(hl.tbool), 1, 2), None),
+            (hl.cond(hl.null(hl.tbool), 1, 2, missing_false=True), 2)])
 
     def test_aggregators(self):
-        table = hl.utils.range_table(10)
+        table = self.range10
         r = table.aggregate(hl.struct(x=agg.count(),
                                       y=agg.count_where(table.idx % 2 == 0),
                                       z=agg.count(agg.filter(lambda x: x % 2 == 0, table.idx)),
@@ -123,7 +195,7 @@ class Tests(unittest.TestCase):
         self.assertTrue(r.assert2)
 
     def test_joins_inside_aggregators(self):
-        table = hl.utils.range_table(10)
+        table = self.range10
         table2 = hl.utils.range_table(10)
         self.assertEqual(table.aggregate(agg.count_where(hl.is_defined(table2[table.idx]))), 10)
 
@@ -136,19 +208,16 @@ class Tests(unittest.TestCase):
             .when('1', 6)
             .when('0', 2)
             .or_missing())
-        self.assertEqual(hl.eval_expr(expr1), 6)
 
         expr2 = (hl.switch(x)
             .when('123', 5)
             .when('0', 2)
             .or_missing())
-        self.assertEqual(hl.eval_expr(expr2), None)
 
         expr3 = (hl.switch(x)
             .when('123', 5)
             .when('0', 2)
             .default(100))
-        self.assertEqual(hl.eval_expr(expr3), 100)
 
         expr4 = (hl.switch(na)
             .when(5, 0)
@@ -156,7 +225,6 @@ class Tests(unittest.TestCase):
             .when(0, 2)
             .when(hl.null(tint32), 3)  # NA != NA
             .default(4))
-        self.assertEqual(hl.eval_expr(expr4), None)
 
         expr5 = (hl.switch(na)
             .when(5, 0)
@@ -165,7 +233,13 @@ class Tests(unittest.TestCase):
             .when(hl.null(tint32), 3)  # NA != NA
             .when_missing(-1)
             .default(4))
-        self.assertEqual(hl.eval_expr(expr5), -1)
+
+        self.check_values([
+            (expr1, 6),
+            (expr2, None),
+            (expr3, 100),
+            (expr4, None),
+            (expr5, -1)])
 
     def test_case(self):
         def make_case(x):
@@ -177,59 +251,54 @@ class Tests(unittest.TestCase):
                 .when(x < 2, 'D')
                 .or_missing())
 
-        self.assertEqual(hl.eval_expr(make_case(6)), 'A')
-        self.assertEqual(hl.eval_expr(make_case(12)), 'B')
-        self.assertEqual(hl.eval_expr(make_case(5)), 'C')
-        self.assertEqual(hl.eval_expr(make_case(-1)), 'D')
-        self.assertEqual(hl.eval_expr(make_case(2)), None)
-
-        self.assertEqual(hl.case().when(hl.null(hl.tbool), 1).default(2).value, None)
-        self.assertEqual(hl.case(missing_false=True).when(hl.null(hl.tbool), 1).default(2).value, 2)
+        self.check_values([
+            (make_case(6), 'A'),
+            (make_case(12), 'B'),
+            (make_case(5), 'C'),
+            (make_case(-1), 'D'),
+            (make_case(2), None),
+            (hl.case().when(hl.null(hl.tbool), 1).default(2), None),
+            (hl.case(missing_false=True).when(hl.null(hl.tbool), 1).default(2), 2)])
 
     def test_struct_ops(self):
         s = hl.struct(f1=1, f2=2, f3=3)
 
-        def assert_typed(expr, result, dtype):
-            self.assertEqual(expr.dtype, dtype)
-            r, t = hl.eval_expr_typed(expr)
-            self.assertEqual(t, dtype)
-            self.assertEqual(result, r)
+        self.check_exprs([
+            (s.drop('f3'),
+             hl.Struct(f1=1, f2=2),
+             tstruct(f1=tint32, f2=tint32)),
 
-        assert_typed(s.drop('f3'),
-                     hl.Struct(f1=1, f2=2),
-                     tstruct(f1=tint32, f2=tint32))
+            (s.drop('f1'),
+             hl.Struct(f2=2, f3=3),
+             tstruct(f2=tint32, f3=tint32)),
 
-        assert_typed(s.drop('f1'),
-                     hl.Struct(f2=2, f3=3),
-                     tstruct(f2=tint32, f3=tint32))
+            (s.drop(),
+             hl.Struct(f1=1, f2=2, f3=3),
+             tstruct(f1=tint32, f2=tint32, f3=tint32)),
 
-        assert_typed(s.drop(),
-                     hl.Struct(f1=1, f2=2, f3=3),
-                     tstruct(f1=tint32, f2=tint32, f3=tint32))
+            (s.select('f1', 'f2'),
+             hl.Struct(f1=1, f2=2),
+             tstruct(f1=tint32, f2=tint32)),
 
-        assert_typed(s.select('f1', 'f2'),
-                     hl.Struct(f1=1, f2=2),
-                     tstruct(f1=tint32, f2=tint32))
+            (s.select('f2', 'f1', f4=5, f5=6),
+             hl.Struct(f2=2, f1=1, f4=5, f5=6),
+             tstruct(f2=tint32, f1=tint32, f4=tint32, f5=tint32)),
 
-        assert_typed(s.select('f2', 'f1', f4=5, f5=6),
-                     hl.Struct(f2=2, f1=1, f4=5, f5=6),
-                     tstruct(f2=tint32, f1=tint32, f4=tint32, f5=tint32))
+            (s.select(),
+             hl.Struct(),
+             tstruct()),
 
-        assert_typed(s.select(),
-                     hl.Struct(),
-                     tstruct())
+            (s.annotate(f1=5, f2=10, f4=15),
+             hl.Struct(f1=5, f2=10, f3=3, f4=15),
+             tstruct(f1=tint32, f2=tint32, f3=tint32, f4=tint32)),
 
-        assert_typed(s.annotate(f1=5, f2=10, f4=15),
-                     hl.Struct(f1=5, f2=10, f3=3, f4=15),
-                     tstruct(f1=tint32, f2=tint32, f3=tint32, f4=tint32))
+            (s.annotate(f1=5),
+             hl.Struct(f1=5, f2=2, f3=3),
+             tstruct(f1=tint32, f2=tint32, f3=tint32)),
 
-        assert_typed(s.annotate(f1=5),
-                     hl.Struct(f1=5, f2=2, f3=3),
-                     tstruct(f1=tint32, f2=tint32, f3=tint32))
-
-        assert_typed(s.annotate(),
-                     hl.Struct(f1=1, f2=2, f3=3),
-                     tstruct(f1=tint32, f2=tint32, f3=tint32))
+            (s.annotate(),
+             hl.Struct(f1=1, f2=2, f3=3),
+             tstruct(f1=tint32, f2=tint32, f3=tint32))])
 
     def test_iter(self):
         a = hl.literal([1, 2, 3])
@@ -237,59 +306,61 @@ class Tests(unittest.TestCase):
 
     def test_dict_get(self):
         d = hl.dict({'a': 1, 'b': 2, 'missing_value': hl.null(hl.tint32)})
-        self.assertEqual(hl.eval_expr(d.get('a')), 1)
-        self.assertEqual(hl.eval_expr(d['a']), 1)
-        self.assertEqual(hl.eval_expr(d.get('b')), 2)
-        self.assertEqual(hl.eval_expr(d['b']), 2)
-        self.assertEqual(hl.eval_expr(d.get('c')), None)
-        self.assertEqual(hl.eval_expr(d.get('c', 5)), 5)
-        self.assertEqual(hl.eval_expr(d.get('a', 5)), 1)
-
-        self.assertEqual(hl.eval_expr(d.get('missing_values')), None)
-        self.assertEqual(hl.eval_expr(d.get('missing_values', hl.null(hl.tint32))), None)
-        self.assertEqual(hl.eval_expr(d.get('missing_values', 5)), 5)
+        self.check_values([
+            (d.get('a'), 1),
+            (d['a'], 1),
+            (d.get('b'), 2),
+            (d['b'], 2),
+            (d.get('c'), None),
+            (d.get('c', 5), 5),
+            (d.get('a', 5), 1),
+
+            (d.get('missing_values'), None),
+            (d.get('missing_values', hl.null(hl.tint32)), None),
+            (d.get('missing_values', 5), 5)])
 
     def test_aggregator_any_and_all(self):
-        df = hl.utils.range_table(10)
-        df = df.annotate(all_true=True,
-                         all_false=False,
-                         true_or_missing=hl.cond(df.idx % 2 == 0, True, hl.null(tbool)),
-                         false_or_missing=hl.cond(df.idx % 2 == 0, False, hl.null(tbool)),
-                         all_missing=hl.null(tbool),
-                         mixed_true_false=hl.cond(df.idx % 2 == 0, True, False),
-                         mixed_all=hl.switch(df.idx % 3)
-                         .when(0, True)
-                         .when(1, False)
-                         .or_missing()).cache()
-
-        self.assertEqual(df.aggregate(agg.any(df.all_true)), True)
-        self.assertEqual(df.aggregate(agg.all(df.all_true)), True)
-        self.assertEqual(df.aggregate(agg.any(df.all_false)), False)
-        self.assertEqual(df.aggregate(agg.any(df.all_false)), False)
-        self.assertEqual(df.aggregate(agg.any(df.true_or_missing)), True)
-        self.assertEqual(df.aggregate(agg.all(df.true_or_missing)), True)
-        self.assertEqual(df.aggregate(agg.any(df.false_or_missing)), False)
-        self.assertEqual(df.aggregate(agg.all(df.false_or_missing)), False)
-        self.assertEqual(df.aggregate(agg.any(df.all_missing)), False)
-        self.assertEqual(df.aggregate(agg.all(df.all_missing)), True)
-        self.assertEqual(df.aggregate(agg.any(df.mixed_true_false)), True)
-        self.assertEqual(df.aggregate(agg.all(df.mixed_true_false)), False)
-        self.assertEqual(df.aggregate(agg.any(df.mixed_all)), True)
-        self.assertEqual(df.aggregate(agg.all(df.mixed_all)), False)
-
-        self.assertEqual(df.aggregate(agg.any(agg.filter(lambda x: False, df.all_true))), False)
-        self.assertEqual(df.aggregate(agg.all(agg.filter(lambda x: False, df.all_true))), True)
+        df = self.bools10
+        r = df.aggregate(hl.struct(
+            any_all_true=agg.any(df.all_true),
+            all_all_true=agg.all(df.all_true),
+            any_all_false=agg.any(df.all_false),
+            all_all_false=agg.all(df.all_false),
+            any_true_or_missing=agg.any(df.true_or_missing),
+            all_true_or_missing=agg.all(df.true_or_missing),
+            any_false_or_missing=agg.any(df.false_or_missing),
+            all_false_or_missing=agg.all(df.false_or_missing),
+            any_all_missing=agg.any(df.all_missing),
+            all_all_missing=agg.all(df.all_missing),
+            any_mixed_true_false=agg.any(df.mixed_true_false),
+            all_mixed_true_false=agg.all(df.mixed_true_false),
+            any_mixed_all=agg.any(df.mixed_all),
+            all_mixed_all=agg.all(df.mixed_all),
+            any_filtered=agg.any(agg.filter(lambda x: False, df.all_true)),
+            all_filtered=agg.all(agg.filter(lambda x: False, df.all_true))))
+
+        self.assertEqual(r.any_all_true, True)
+        self.assertEqual(r.all_all_true, True)
+        self.assertEqual(r.any_all_false, False)
+        self.assertEqual(r.all_all_false, False)
+        self.assertEqual(r.any_true_or_missing, True)
+        self.assertEqual(r.all_true_or_missing, True)
+        self.assertEqual(r.any_false_or_missing, False)
+        self.assertEqual(r.all_false_or_missing, False)
+        self.assertEqual(r.any_all_missing, False)
+        self.assertEqual(r.all_all_missing, True)
+        self.assertEqual(r.any_mixed_true_false, True)
+        self.assertEqual(r.all_mixed_true_false, False)
+        self.assertEqual(r.any_mixed_all, True)
+        self.assertEqual(r.all_mixed_all, False)
+
+        self.assertEqual(r.any_filtered, False)
+        self.assertEqual(r.all_filtered, True)
 
     def test_str_ops(self):
-        s = hl.literal("123")
-        self.assertEqual(hl.eval_expr(hl.int32(s)), 123)
-
-        s = hl.literal("123123123123")
-        self.assertEqual(hl.eval_expr(hl.int64(s)), 123123123123)
-
-        s = hl.literal("1.5")
-        self.assertEqual(hl.eval_expr(hl.float32(s)), 1.5)
-        self.assertEqual(hl.eval_expr(hl.float64(s)), 1.5)
+        s_int32 = hl.literal("123")
+        s_int64 = hl.literal("123123123123")
+        s_float = hl.literal("1.5")
 
         s1 = hl.literal('true')
         s2 = hl.literal('True')
@@ -299,629 +370,242 @@ class Tests(unittest.TestCase):
         s5 = hl.literal('False')
         s6 = hl.literal('FALSE')
 
-        self.assertTrue(hl.eval_expr(hl.bool(s1)))
-        self.assertTrue(hl.eval_expr(hl.bool(s2)))
-        self.assertTrue(hl.eval_expr(hl.bool(s3)))
+        s = hl.literal('abcABC123')
+        s_whitespace = hl.literal(' \t 1 2 3 \t\n')
 
-        self.assertFalse(hl.eval_expr(hl.bool(s4)))
-        self.assertFalse(hl.eval_expr(hl.bool(s5)))
-        self.assertFalse(hl.eval_expr(hl.bool(s6)))
+        self.check_values([
+            (hl.int32(s_int32), 123),
+            (hl.int64(s_int64), 123123123123),
+            (hl.float32(s_float), 1.5),
+            (hl.float64(s_float), 1.5),
 
-        # lower
-        s = hl.literal('abcABC123')
-        self.assertEqual(s.lower().value, 'abcabc123')
-        self.assertEqual(s.upper().value, 'ABCABC123')
+            (hl.bool(s1), True),
+            (hl.bool(s2), True),
+            (hl.bool(s3), True),
 
-        s_whitespace = hl.literal(' \t 1 2 3 \t\n')
-        self.assertEqual(s_whitespace.strip().value, '1 2 3')
+            (hl.bool(s4), False),
+            (hl.bool(s5), False),
+            (hl.bool(s6), False),
+
+            # lower
+            (s.lower(), 'abcabc123'),
+            (s.upper(), 'ABCABC123'),
+
+            (s_whitespace.strip(), '1 2 3'),
 
-        self.assertEqual(s.contains('ABC').value, True)
-        self.assertEqual(s.contains('a').value, True)
-        self.assertEqual(s.contains('C123').value, True)
-        self.assertEqual(s.contains('').value, True)
-        self.assertEqual(s.contains('C1234').value, False)
-        self.assertEqual(s.contains(' ').value, False)
+            (s.contains('ABC'), True),
+            (s.contains('a'), True),
+            (s.contains('C123'), True),
+            (s.contains(''), True),
+            (s.contains('C1234'), False),
+            (s.contains(' '), False)])
 
     def check_expr(self, expr, expected, expected_type):
         self.assertEqual(expected_type, expr.dtype)
         self.assertEqual((expected, expected_type), hl.eval_expr_typed(expr))
 
+    def check_values(self, cases):
+        # evaluates every (expr, expected) case in one round trip
+        values = hl.eval_expr(hl.struct(**{'c{}'.format(i): expr for i, (expr, _) in enumerate(cases)}))
+        for i, (_, expected) in enumerate(cases):
+            self.assertEqual(expected, values['c{}'.format(i)])
+
+    def check_exprs(self, cases):
+        # evaluates every (expr, expected, expected_type) case in one round trip
+        fields = {'c{}'.format(i): expr for i, (expr, _, _) in enumerate(cases)}
+        result, typ = hl.eval_expr_typed(hl.struct(**fields))
+        for i, (expr, expected, expected_type) in enumerate(cases):
+            name = 'c{}'.format(i)
+            self.assertEqual(expected_type, expr.dtype)
+            self.assertEqual(expected_type, typ[name])
+            self.assertEqual(expected, result[name])
+
     def test_division(self):
-        a_int32 = hl.array([2, 4, 8, 16, hl.null(tint32)])
-        a_int64 = a_int32.map(lambda x: hl.int64(x))
-        a_float32 = a_int32.map(lambda x: hl.float32(x))
-        a_float64 = a_int32.map(lambda x: hl.float64(x))
+        a_int32, a_int64, a_float32, a_float64 = self.a_int32, self.a_int64, self.a_float32, self.a_float64
         int32_4s = hl.array([4, 4, 4, 4, hl.null(tint32)])
-        int64_4 = hl.int64(4)
-        int64_4s = int32_4s.map(lambda x: hl.int64(x))
-        float32_4 = hl.float32(4)
-        float32_4s = int32_4s.map(lambda x: hl.float32(x))
-        float64_4 = hl.float64(4)
-        float64_4s = int32_4s.map(lambda x: hl.float64(x))
+        int64_4 = _lit(4, tint64)
+        int64_4s = _typed_array([4, 4, 4, 4, None], tint64)
+        float32_4 = _lit(4, tfloat32)
+        float32_4s = _typed_array([4, 4, 4, 4, None], tfloat32)
+        float64_4 = _lit(4, tfloat64)
+        float64_4s = _typed_array([4, 4, 4, 4, None], tfloat64)
 
         expected = [0.5, 1.0, 2.0, 4.0, None]
         expected_inv = [2.0, 1.0, 0.5, 0.25, None]
 
-        self.check_expr(a_int32 / 4, expected, tarray(tfloat32))
-        self.check_expr(a_int64 / 4, expected, tarray(tfloat32))
-        self.check_expr(a_float32 / 4, expected, tarray(tfloat32))
-        self.check_expr(a_float64 / 4, expected, tarray(tfloat64))
-
-        self.check_expr(int32_4s / a_int32, expected_inv, tarray(tfloat32))
-        self.check_expr(int32_4s / a_int64, expected_inv, tarray(tfloat32))
-        self.check_expr(int32_4s / a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(int32_4s / a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 / int32_4s, expected, tarray(tfloat32))
-        self.check_expr(a_int64 / int32_4s, expected, tarray(tfloat32))
-        self.check_expr(a_float32 / int32_4s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 / int32_4s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 / int64_4, expected, tarray(tfloat32))
-        self.check_expr(a_int64 / int64_4, expected, tarray(tfloat32))
-        self.check_expr(a_float32 / int64_4, expected, tarray(tfloat32))
-        self.check_expr(a_float64 / int64_4, expected, tarray(tfloat64))
-
-        self.check_expr(int64_4 / a_int32, expected_inv, tarray(tfloat32))
-        self.check_expr(int64_4 / a_int64, expected_inv, tarray(tfloat32))
-        self.check_expr(int64_4 / a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(int64_4 / a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 / int64_4s, expected, tarray(tfloat32))
-        self.check_expr(a_int64 / int64_4s, expected, tarray(tfloat32))
-        self.check_expr(a_float32 / int64_4s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 / int64_4s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 / float32_4, expected, tarray(tfloat32))
-        self.check_expr(a_int64 / float32_4, expected, tarray(tfloat32))
-        self.check_expr(a_float32 / float32_4, expected, tarray(tfloat32))
-        self.check_expr(a_float64 / float32_4, expected, tarray(tfloat64))
-
-        self.check_expr(float32_4 / a_int32, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_4 / a_int64, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_4 / a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_4 / a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 / float32_4s, expected, tarray(tfloat32))
-        self.check_expr(a_int64 / float32_4s, expected, tarray(tfloat32))
-        self.check_expr(a_float32 / float32_4s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 / float32_4s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 / float64_4, expected, tarray(tfloat64))
-        self.check_expr(a_int64 / float64_4, expected, tarray(tfloat64))
-        self.check_expr(a_float32 / float64_4, expected, tarray(tfloat64))
-        self.check_expr(a_float64 / float64_4, expected, tarray(tfloat64))
-
-        self.check_expr(float64_4 / a_int32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_4 / a_int64, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_4 / a_float32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_4 / a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 / float64_4s, expected, tarray(tfloat64))
-        self.check_expr(a_int64 / float64_4s, expected, tarray(tfloat64))
-        self.check_expr(a_float32 / float64_4s, expected, tarray(tfloat64))
-        self.check_expr(a_float64 / float64_4s, expected, tarray(tfloat64))
+        self.check_exprs([
+            (a_int32 / 4, expected, tarray(tfloat32)),
+            (a_int64 / 4, expected, tarray(tfloat32)),
+            (a_float32 / 4, expected, tarray(tfloat32)),
+            (a_float64 / 4, expected, tarray(tfloat64)),
+
+            (int32_4s / a_int32, expected_inv, tarray(tfloat32)),
+            (int32_4s / a_int64, expected_inv, tarray(tfloat32)),
+            (int32_4s / a_float32, expected_inv, tarray(tfloat32)),
+            (int32_4s / a_float64, expected_inv, tarray(tfloat64)),
+
+            (a_int32 / int32_4s, expected, tarray(tfloat32)),
+            (a_int64 / int32_4s, expected, tarray(tfloat32)),
+            (a_float32 / int32_4s, expected, tarray(tfloat32)),
+            (a_float64 / int32_4s, expected, tarray(tfloat64)),
+
+            (a_int32 / int64_4, expected, tarray(tfloat32)),
+            (a_int64 / int64_4, expected, tarray(tfloat32)),
+            (a_float32 / int64_4, expected, tarray(tfloat32)),
+            (a_float64 / int64_4, expected, tarray(tfloat64)),
+
+            (int64_4 / a_int32, expected_inv, tarray(tfloat32)),
+            (int64_4 / a_int64, expected_inv, tarray(tfloat32)),
+            (int64_4 / a_float32, expected_inv, tarray(tfloat32)),
+            (int64_4 / a_float64, expected_inv, tarray(tfloat64)),
+
+            (a_int32 / int64_4s, expected, tarray(tfloat32)),
+            (a_int64 / int64_4s, expected, tarray(tfloat32)),
+            (a_float32 / int64_4s, expected, tarray(tfloat32)),
+            (a_float64 / int64_4s, expected, tarray(tfloat64)),
+
+            (a_int32 / float32_4, expected, tarray(tfloat32)),
+            (a_int64 / float32_4, expected, tarray(tfloat32)),
+            (a_float32 / float32_4, expected, tarray(tfloat32)),
+            (a_float64 / float32_4, expected, tarray(tfloat64)),
+
+            (float32_4 / a_int32, expected_inv, tarray(tfloat32)),
+            (float32_4 / a_int64, expected_inv, tarray(tfloat32)),
+            (float32_4 / a_float32, expected_inv, tarray(tfloat32)),
+            (float32_4 / a_float64, expected_inv, tarray(tfloat64)),
+
+            (a_int32 / float32_4s, expected, tarray(tfloat32)),
+            (a_int64 / float32_4s, expected, tarray(tfloat32)),
+            (a_float32 / float32_4s, expected, tarray(tfloat32)),
+            (a_float64 / float32_4s, expected, tarray(tfloat64)),
+
+            (a_int32 / float64_4, expected, tarray(tfloat64)),
+            (a_int64 / float64_4, expected, tarray(tfloat64)),
+            (a_float32 / float64_4, expected, tarray(tfloat64)),
+            (a_float64 / float64_4, expected, tarray(tfloat64)),
+
+            (float64_4 / a_int32, expected_inv, tarray(tfloat64)),
+            (float64_4 / a_int64, expected_inv, tarray(tfloat64)),
+            (float64_4 / a_float32, expected_inv, tarray(tfloat64)),
+            (float64_4 / a_float64, expected_inv, tarray(tfloat64)),
+
+            (a_int32 / float64_4s, expected, tarray(tfloat64)),
+            (a_int64 / float64_4s, expected, tarray(tfloat64)),
+            (a_float32 / float64_4s, expected, tarray(tfloat64)),
+            (a_float64 / float64_4s, expected, tarray(tfloat64))])
 
     def test_floor_division(self):
-        a_int32 = hl.array([2, 4, 8, 16, hl.null(tint32)])
-        a_int64 = a_int32.map(lambda x: hl.int64(x))
-        a_float32 = a_int32.map(lambda x: hl.float32(x))
-        a_float64 = a_int32.map(lambda x: hl.float64(x))
-        int32_4s = hl.array([4, 4, 4, 4, hl.null(tint32)])
-        int32_3s = hl.array([3, 3, 3, 3, hl.null(tint32)])
-        int64_3 = hl.int64(3)
-        int64_3s = int32_3s.map(lambda x: hl.int64(x))
-        float32_3 = hl.float32(3)
-        float32_3s = int32_3s.map(lambda x: hl.float32(x))
-        float64_3 = hl.float64(3)
-        float64_3s = int32_3s.map(lambda x: hl.float64(x))
-
         expected = [0, 1, 2, 5, None]
         expected_inv = [1, 0, 0, 0, None]
-
-        self.check_expr(a_int32 // 3, expected, tarray(tint32))
-        self.check_expr(a_int64 // 3, expected, tarray(tint64))
-        self.check_expr(a_float32 // 3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 // 3, expected, tarray(tfloat64))
-
-        self.check_expr(3 // a_int32, expected_inv, tarray(tint32))
-        self.check_expr(3 // a_int64, expected_inv, tarray(tint64))
-        self.check_expr(3 // a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(3 // a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 // int32_3s, expected, tarray(tint32))
-        self.check_expr(a_int64 // int32_3s, expected, tarray(tint64))
-        self.check_expr(a_float32 // int32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 // int32_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 // int64_3, expected, tarray(tint64))
-        self.check_expr(a_int64 // int64_3, expected, tarray(tint64))
-        self.check_expr(a_float32 // int64_3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 // int64_3, expected, tarray(tfloat64))
-
-        self.check_expr(int64_3 // a_int32, expected_inv, tarray(tint64))
-        self.check_expr(int64_3 // a_int64, expected_inv, tarray(tint64))
-        self.check_expr(int64_3 // a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(int64_3 // a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 // int64_3s, expected, tarray(tint64))
-        self.check_expr(a_int64 // int64_3s, expected, tarray(tint64))
-        self.check_expr(a_float32 // int64_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 // int64_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 // float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_int64 // float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_float32 // float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 // float32_3, expected, tarray(tfloat64))
-
-        self.check_expr(float32_3 // a_int32, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 // a_int64, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 // a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 // a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 // float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_int64 // float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float32 // float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 // float32_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 // float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_int64 // float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float32 // float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float64 // float64_3, expected, tarray(tfloat64))
-
-        self.check_expr(float64_3 // a_int32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 // a_int64, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 // a_float32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 // a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 // float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_int64 // float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float32 // float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float64 // float64_3s, expected, tarray(tfloat64))
+        self.check_arithmetic(operator.floordiv, expected, expected_inv)
 
     def test_addition(self):
-        a_int32 = hl.array([2, 4, 8, 16, hl.null(tint32)])
-        a_int64 = a_int32.map(lambda x: hl.int64(x))
-        a_float32 = a_int32.map(lambda x: hl.float32(x))
-        a_float64 = a_int32.map(lambda x: hl.float64(x))
-        int32_4s = hl.array([4, 4, 4, 4, hl.null(tint32)])
-        int32_3s = hl.array([3, 3, 3, 3, hl.null(tint32)])
-        int64_3 = hl.int64(3)
-        int64_3s = int32_3s.map(lambda x: hl.int64(x))
-        float32_3 = hl.float32(3)
-        float32_3s = int32_3s.map(lambda x: hl.float32(x))
-        float64_3 = hl.float64(3)
-        float64_3s = int32_3s.map(lambda x: hl.float64(x))
-
         expected = [5, 7, 11, 19, None]
-        expected_inv = expected
-
-        self.check_expr(a_int32 + 3, expected, tarray(tint32))
-        self.check_expr(a_int64 + 3, expected, tarray(tint64))
-        self.check_expr(a_float32 + 3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 + 3, expected, tarray(tfloat64))
-
-        self.check_expr(3 + a_int32, expected_inv, tarray(tint32))
-        self.check_expr(3 + a_int64, expected_inv, tarray(tint64))
-        self.check_expr(3 + a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(3 + a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 + int32_3s, expected, tarray(tint32))
-        self.check_expr(a_int64 + int32_3s, expected, tarray(tint64))
-        self.check_expr(a_float32 + int32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 + int32_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 + int64_3, expected, tarray(tint64))
-        self.check_expr(a_int64 + int64_3, expected, tarray(tint64))
-        self.check_expr(a_float32 + int64_3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 + int64_3, expected, tarray(tfloat64))
-
-        self.check_expr(int64_3 + a_int32, expected_inv, tarray(tint64))
-        self.check_expr(int64_3 + a_int64, expected_inv, tarray(tint64))
-        self.check_expr(int64_3 + a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(int64_3 + a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 + int64_3s, expected, tarray(tint64))
-        self.check_expr(a_int64 + int64_3s, expected, tarray(tint64))
-        self.check_expr(a_float32 + int64_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 + int64_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 + float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_int64 + float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_float32 + float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 + float32_3, expected, tarray(tfloat64))
-
-        self.check_expr(float32_3 + a_int32, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 + a_int64, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 + a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 + a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 + float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_int64 + float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float32 + float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 + float32_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 + float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_int64 + float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float32 + float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float64 + float64_3, expected, tarray(tfloat64))
-
-        self.check_expr(float64_3 + a_int32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 + a_int64, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 + a_float32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 + a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 + float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_int64 + float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float32 + float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float64 + float64_3s, expected, tarray(tfloat64))
+        self.check_arithmetic(operator.add, expected, expected)
 
     def test_subtraction(self):
-        a_int32 = hl.array([2, 4, 8, 16, hl.null(tint32)])
-        a_int64 = a_int32.map(lambda x: hl.int64(x))
-        a_float32 = a_int32.map(lambda x: hl.float32(x))
-        a_float64 = a_int32.map(lambda x: hl.float64(x))
-        int32_4s = hl.array([4, 4, 4, 4, hl.null(tint32)])
-        int32_3s = hl.array([3, 3, 3, 3, hl.null(tint32)])
-        int64_3 = hl.int64(3)
-        int64_3s = int32_3s.map(lambda x: hl.int64(x))
-        float32_3 = hl.float32(3)
-        float32_3s = int32_3s.map(lambda x: hl.float32(x))
-        float64_3 = hl.float64(3)
-        float64_3s = int32_3s.map(lambda x: hl.float64(x))
-
         expected = [-1, 1, 5, 13, None]
         expected_inv = [1, -1, -5, -13, None]
-
-        self.check_expr(a_int32 - 3, expected, tarray(tint32))
-        self.check_expr(a_int64 - 3, expected, tarray(tint64))
-        self.check_expr(a_float32 - 3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 - 3, expected, tarray(tfloat64))
-
-        self.check_expr(3 - a_int32, expected_inv, tarray(tint32))
-        self.check_expr(3 - a_int64, expected_inv, tarray(tint64))
-        self.check_expr(3 - a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(3 - a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 - int32_3s, expected, tarray(tint32))
-        self.check_expr(a_int64 - int32_3s, expected, tarray(tint64))
-        self.check_expr(a_float32 - int32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 - int32_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 - int64_3, expected, tarray(tint64))
-        self.check_expr(a_int64 - int64_3, expected, tarray(tint64))
-        self.check_expr(a_float32 - int64_3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 - int64_3, expected, tarray(tfloat64))
-
-        self.check_expr(int64_3 - a_int32, expected_inv, tarray(tint64))
-        self.check_expr(int64_3 - a_int64, expected_inv, tarray(tint64))
-        self.check_expr(int64_3 - a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(int64_3 - a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 - int64_3s, expected, tarray(tint64))
-        self.check_expr(a_int64 - int64_3s, expected, tarray(tint64))
-        self.check_expr(a_float32 - int64_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 - int64_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 - float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_int64 - float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_float32 - float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 - float32_3, expected, tarray(tfloat64))
-
-        self.check_expr(float32_3 - a_int32, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 - a_int64, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 - a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 - a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 - float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_int64 - float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float32 - float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 - float32_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 - float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_int64 - float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float32 - float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float64 - float64_3, expected, tarray(tfloat64))
-
-        self.check_expr(float64_3 - a_int32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 - a_int64, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 - a_float32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 - a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 - float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_int64 - float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float32 - float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float64 - float64_3s, expected, tarray(tfloat64))
+        self.check_arithmetic(operator.sub, expected, expected_inv)
+
+    def check_arithmetic(self, op, expected, expected_inv, result_type=None):
+        # applies op between every numeric array and every operand, in both orders for scalars; the result
+        # type is result_type if given, otherwise the wider of the two element types
+        arrays = [(self.a_int32, tint32), (self.a_int64, tint64),
+                  (self.a_float32, tfloat32), (self.a_float64, tfloat64)]
+        operands = [(3, tint32, True), (self.int32_3s, tint32, False),
+                    (self.int64_3, tint64, True), (self.int64_3s, tint64, False),
+                    (self.float32_3, tfloat32, True), (self.float32_3s, tfloat32, False),
+                    (self.float64_3, tfloat64, True), (self.float64_3s, tfloat64, False)]
+
+        array_types = {t: tarray(t) for t in _numeric_types}
+
+        def typ(t1, t2):
+            return array_types[result_type or max(t1, t2, key=_numeric_types.index)]
+
+        cases = []
+        for x, xt, is_scalar in operands:
+            cases.extend((op(a, x), expected, typ(at, xt)) for a, at in arrays)
+            if is_scalar:
+                cases.extend((op(x, a), expected_inv, typ(xt, at)) for a, at in arrays)
+        self.check_exprs(cases)
 
     def test_multiplication(self):
-        a_int32 = hl.array([2, 4, 8, 16, hl.null(tint32)])
-        a_int64 = a_int32.map(lambda x: hl.int64(x))
-        a_float32 = a_int32.map(lambda x: hl.float32(x))
-        a_float64 = a_int32.map(lambda x: hl.float64(x))
-        int32_4s = hl.array([4, 4, 4, 4, hl.null(tint32)])
-        int32_3s = hl.array([3, 3, 3, 3, hl.null(tint32)])
-        int64_3 = hl.int64(3)
-        int64_3s = int32_3s.map(lambda x: hl.int64(x))
-        float32_3 = hl.float32(3)
-        float32_3s = int32_3s.map(lambda x: hl.float32(x))
-        float64_3 = hl.float64(3)
-        float64_3s = int32_3s.map(lambda x: hl.float64(x))
-
         expected = [6, 12, 24, 48, None]
-        expected_inv = expected
-
-        self.check_expr(a_int32 * 3, expected, tarray(tint32))
-        self.check_expr(a_int64 * 3, expected, tarray(tint64))
-        self.check_expr(a_float32 * 3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 * 3, expected, tarray(tfloat64))
-
-        self.check_expr(3 * a_int32, expected_inv, tarray(tint32))
-        self.check_expr(3 * a_int64, expected_inv, tarray(tint64))
-        self.check_expr(3 * a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(3 * a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 * int32_3s, expected, tarray(tint32))
-        self.check_expr(a_int64 * int32_3s, expected, tarray(tint64))
-        self.check_expr(a_float32 * int32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 * int32_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 * int64_3, expected, tarray(tint64))
-        self.check_expr(a_int64 * int64_3, expected, tarray(tint64))
-        self.check_expr(a_float32 * int64_3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 * int64_3, expected, tarray(tfloat64))
-
-        self.check_expr(int64_3 * a_int32, expected_inv, tarray(tint64))
-        self.check_expr(int64_3 * a_int64, expected_inv, tarray(tint64))
-        self.check_expr(int64_3 * a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(int64_3 * a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 * int64_3s, expected, tarray(tint64))
-        self.check_expr(a_int64 * int64_3s, expected, tarray(tint64))
-        self.check_expr(a_float32 * int64_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 * int64_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 * float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_int64 * float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_float32 * float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 * float32_3, expected, tarray(tfloat64))
-
-        self.check_expr(float32_3 * a_int32, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 * a_int64, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 * a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 * a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 * float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_int64 * float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float32 * float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 * float32_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 * float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_int64 * float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float32 * float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float64 * float64_3, expected, tarray(tfloat64))
-
-        self.check_expr(float64_3 * a_int32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 * a_int64, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 * a_float32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 * a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 * float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_int64 * float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float32 * float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float64 * float64_3s, expected, tarray(tfloat64))
+        self.check_arithmetic(operator.mul, expected, expected)
 
     def test_exponentiation(self):
-        a_int32 = hl.array([2, 4, 8, 16, hl.null(tint32)])
-        a_int64 = a_int32.map(lambda x: hl.int64(x))
-        a_float32 = a_int32.map(lambda x: hl.float32(x))
-        a_float64 = a_int32.map(lambda x: hl.float64(x))
-        int32_4s = hl.array([4, 4, 4, 4, hl.null(tint32)])
-        int32_3s = hl.array([3, 3, 3, 3, hl.null(tint32)])
-        int64_3 = hl.int64(3)
-        int64_3s = int32_3s.map(lambda x: hl.int64(x))
-        float32_3 = hl.float32(3)
-        float32_3s = int32_3s.map(lambda x: hl.float32(x))
-        float64_3 = hl.float64(3)
-        float64_3s = int32_3s.map(lambda x: hl.float64(x))
-
         expected = [8, 64, 512, 4096, None]
         expected_inv = [9.0, 81.0, 6561.0, 43046721.0, None]
-
-        self.check_expr(a_int32 ** 3, expected, tarray(tfloat64))
-        self.check_expr(a_int64 ** 3, expected, tarray(tfloat64))
-        self.check_expr(a_float32 ** 3, expected, tarray(tfloat64))
-        self.check_expr(a_float64 ** 3, expected, tarray(tfloat64))
-
-        self.check_expr(3 ** a_int32, expected_inv, tarray(tfloat64))
-        self.check_expr(3 ** a_int64, expected_inv, tarray(tfloat64))
-        self.check_expr(3 ** a_float32, expected_inv, tarray(tfloat64))
-        self.check_expr(3 ** a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 ** int32_3s, expected, tarray(tfloat64))
-        self.check_expr(a_int64 ** int32_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float32 ** int32_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float64 ** int32_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 ** int64_3, expected, tarray(tfloat64))
-        self.check_expr(a_int64 ** int64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float32 ** int64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float64 ** int64_3, expected, tarray(tfloat64))
-
-        self.check_expr(int64_3 ** a_int32, expected_inv, tarray(tfloat64))
-        self.check_expr(int64_3 ** a_int64, expected_inv, tarray(tfloat64))
-        self.check_expr(int64_3 ** a_float32, expected_inv, tarray(tfloat64))
-        self.check_expr(int64_3 ** a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 ** int64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_int64 ** int64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float32 ** int64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float64 ** int64_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 ** float32_3, expected, tarray(tfloat64))
-        self.check_expr(a_int64 ** float32_3, expected, tarray(tfloat64))
-        self.check_expr(a_float32 ** float32_3, expected, tarray(tfloat64))
-        self.check_expr(a_float64 ** float32_3, expected, tarray(tfloat64))
-
-        self.check_expr(float32_3 ** a_int32, expected_inv, tarray(tfloat64))
-        self.check_expr(float32_3 ** a_int64, expected_inv, tarray(tfloat64))
-        self.check_expr(float32_3 ** a_float32, expected_inv, tarray(tfloat64))
-        self.check_expr(float32_3 ** a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 ** float32_3s, expected, tarray(tfloat64))
-        self.check_expr(a_int64 ** float32_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float32 ** float32_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float64 ** float32_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 ** float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_int64 ** float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float32 ** float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float64 ** float64_3, expected, tarray(tfloat64))
-
-        self.check_expr(float64_3 ** a_int32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 ** a_int64, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 ** a_float32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 ** a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 ** float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_int64 ** float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float32 ** float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float64 ** float64_3s, expected, tarray(tfloat64))
+        self.check_arithmetic(operator.pow, expected, expected_inv, result_type=tfloat64)
 
     def test_modulus(self):
-        a_int32 = hl.array([2, 4, 8, 16, hl.null(tint32)])
-        a_int64 = a_int32.map(lambda x: hl.int64(x))
-        a_float32 = a_int32.map(lambda x: hl.float32(x))
-        a_float64 = a_int32.map(lambda x: hl.float64(x))
-        int32_4s = hl.array([4, 4, 4, 4, hl.null(tint32)])
-        int32_3s = hl.array([3, 3, 3, 3, hl.null(tint32)])
-        int64_3 = hl.int64(3)
-        int64_3s = int32_3s.map(lambda x: hl.int64(x))
-        float32_3 = hl.float32(3)
-        float32_3s = int32_3s.map(lambda x: hl.float32(x))
-        float64_3 = hl.float64(3)
-        float64_3s = int32_3s.map(lambda x: hl.float64(x))
-
         expected = [2, 1, 2, 1, None]
         expected_inv = [1, 3, 3, 3, None]
-
-        self.check_expr(a_int32 % 3, expected, tarray(tint32))
-        self.check_expr(a_int64 % 3, expected, tarray(tint64))
-        self.check_expr(a_float32 % 3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 % 3, expected, tarray(tfloat64))
-
-        self.check_expr(3 % a_int32, expected_inv, tarray(tint32))
-        self.check_expr(3 % a_int64, expected_inv, tarray(tint64))
-        self.check_expr(3 % a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(3 % a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 % int32_3s, expected, tarray(tint32))
-        self.check_expr(a_int64 % int32_3s, expected, tarray(tint64))
-        self.check_expr(a_float32 % int32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 % int32_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 % int64_3, expected, tarray(tint64))
-        self.check_expr(a_int64 % int64_3, expected, tarray(tint64))
-        self.check_expr(a_float32 % int64_3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 % int64_3, expected, tarray(tfloat64))
-
-        self.check_expr(int64_3 % a_int32, expected_inv, tarray(tint64))
-        self.check_expr(int64_3 % a_int64, expected_inv, tarray(tint64))
-        self.check_expr(int64_3 % a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(int64_3 % a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 % int64_3s, expected, tarray(tint64))
-        self.check_expr(a_int64 % int64_3s, expected, tarray(tint64))
-        self.check_expr(a_float32 % int64_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 % int64_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 % float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_int64 % float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_float32 % float32_3, expected, tarray(tfloat32))
-        self.check_expr(a_float64 % float32_3, expected, tarray(tfloat64))
-
-        self.check_expr(float32_3 % a_int32, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 % a_int64, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 % a_float32, expected_inv, tarray(tfloat32))
-        self.check_expr(float32_3 % a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 % float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_int64 % float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float32 % float32_3s, expected, tarray(tfloat32))
-        self.check_expr(a_float64 % float32_3s, expected, tarray(tfloat64))
-
-        self.check_expr(a_int32 % float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_int64 % float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float32 % float64_3, expected, tarray(tfloat64))
-        self.check_expr(a_float64 % float64_3, expected, tarray(tfloat64))
-
-        self.check_expr(float64_3 % a_int32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 % a_int64, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 % a_float32, expected_inv, tarray(tfloat64))
-        self.check_expr(float64_3 % a_float64, expected_inv, tarray(tfloat64))
-
-        self.check_expr(a_int32 % float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_int64 % float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float32 % float64_3s, expected, tarray(tfloat64))
-        self.check_expr(a_float64 % float64_3s, expected, tarray(tfloat64))
+        self.check_arithmetic(operator.mod, expected, expected_inv)
 
     def test_bools_can_math(self):
-        b1 = hl.literal(True)
-        b2 = hl.literal(False)
+        b1 = _lit(True)
+        b2 = _lit(False)
 
         b_array = hl.literal([True, False])
         f1 = hl.float64(5.5)
         f_array = hl.array([1.5, 2.5])
 
-        self.assertEqual((b1 * b2).value, 0)
-        self.assertEqual((b1 + b2).value, 1)
-        self.assertEqual((b1 - b2).value, 1)
-        self.assertEqual((b1 / b1).value, 1.0)
-        self.assertEqual((f1 * b2).value, 0.0)
-        self.assertEqual((b_array + f1).value, [6.5, 5.5])
-        self.assertEqual((b_array + f_array).value, [2.5, 2.5])
+        self.check_values([
+            (b1 * b2, 0),
+            (b1 + b2, 1),
+            (b1 - b2, 1),
+            (b1 / b1, 1.0),
+            (f1 * b2, 0.0),
+            (b_array + f1, [6.5, 5.5]),
+            (b_array + f_array, [2.5, 2.5])])
 
 
     def test_allele_methods(self):
-        self.assertTrue(hl.eval_expr(hl.is_transition("A", "G")))
-        self.assertFalse(hl.eval_expr(hl.is_transversion("A", "G")))
-        self.assertTrue(hl.eval_expr(hl.is_transversion("A", "T")))
-        self.assertFalse(hl.eval_expr(hl.is_transition("A", "T")))
-        self.assertTrue(hl.eval_expr(hl.is_snp("A", "T")))
-        self.assertTrue(hl.eval_expr(hl.is_snp("A", "G")))
-        self.assertTrue(hl.eval_expr(hl.is_snp("C", "G")))
-        self.assertTrue(hl.eval_expr(hl.is_snp("CC", "CG")))
-        self.assertTrue(hl.eval_expr(hl.is_snp("AT", "AG")))
-        self.assertTrue(hl.eval_expr(hl.is_snp("ATCCC", "AGCCC")))
-        self.assertTrue(hl.eval_expr(hl.is_mnp("ACTGAC", "ATTGTT")))
-        self.assertTrue(hl.eval_expr(hl.is_mnp("CA", "TT")))
-        self.assertTrue(hl.eval_expr(hl.is_insertion("A", "ATGC")))
-        self.assertTrue(hl.eval_expr(hl.is_insertion("ATT", "ATGCTT")))
-        self.assertTrue(hl.eval_expr(hl.is_deletion("ATGC", "A")))
-        self.assertTrue(hl.eval_expr(hl.is_deletion("GTGTA", "GTA")))
-        self.assertTrue(hl.eval_expr(hl.is_indel("A", "ATGC")))
-        self.assertTrue(hl.eval_expr(hl.is_indel("ATT", "ATGCTT")))
-        self.assertTrue(hl.eval_expr(hl.is_indel("ATGC", "A")))
-        self.assertTrue(hl.eval_expr(hl.is_indel("GTGTA", "GTA")))
-        self.assertTrue(hl.eval_expr(hl.is_complex("CTA", "ATTT")))
-        self.assertTrue(hl.eval_expr(hl.is_complex("A", "TATGC")))
-        self.assertTrue(hl.eval_expr(hl.is_star("ATC", "*")))
-        self.assertTrue(hl.eval_expr(hl.is_star("A", "*")))
-        self.assertTrue(hl.eval_expr(hl.is_star("*", "ATC")))
-        self.assertTrue(hl.eval_expr(hl.is_star("*", "A")))
-        self.assertTrue(hl.eval_expr(hl.is_strand_ambiguous("A", "T")))
-        self.assertFalse(hl.eval_expr(hl.is_strand_ambiguous("G", "T")))
+        self.check_values([
+            (hl.is_transition("A", "G"), True),
+            (hl.is_transversion("A", "G"), False),
+            (hl.is_transversion("A", "T"), True),
+            (hl.is_transition("A", "T"), False),
+            (hl.is_snp("A", "T"), True),
+            (hl.is_snp("A", "G"), True),
+            (hl.is_snp("C", "G"), True),
+            (hl.is_snp("CC", "CG"), True),
+            (hl.is_snp("AT", "AG"), True),
+            (hl.is_snp("ATCCC", "AGCCC"), True),
+            (hl.is_mnp("ACTGAC", "ATTGTT"), True),
+            (hl.is_mnp("CA", "TT"), True),
+            (hl.is_insertion("A", "ATGC"), True),
+            (hl.is_insertion("ATT", "ATGCTT"), True),
+            (hl.is_deletion("ATGC", "A"), True),
+            (hl.is_deletion("GTGTA", "GTA"), True),
+            (hl.is_indel("A", "ATGC"), True),
+            (hl.is_indel("ATT", "ATGCTT"), True),
+            (hl.is_indel("ATGC", "A"), True),
+            (hl.is_indel("GTGTA", "GTA"), True),
+            (hl.is_complex("CTA", "ATTT"), True),
+            (hl.is_complex("A", "TATGC"), True),
+            (hl.is_star("ATC", "*"), True),
+            (hl.is_star("A", "*"), True),
+            (hl.is_star("*", "ATC"), True),
+            (hl.is_star("*", "A"), True),
+            (hl.is_strand_ambiguous("A", "T"), True),
+            (hl.is_strand_ambiguous("G", "T"), False)])
 
     def test_hamming(self):
-        self.assertEqual(hl.eval_expr(hl.hamming('A', 'T')), 1)
-        self.assertEqual(hl.eval_expr(hl.hamming('AAAAA', 'AAAAT')), 1)
-        self.assertEqual(hl.eval_expr(hl.hamming('abcde', 'edcba')), 4)
+        self.check_values([
+            (hl.hamming('A', 'T'), 1),
+            (hl.hamming('AAAAA', 'AAAAT'), 1),
+            (hl.hamming('abcde', 'edcba'), 4)])
 
     def test_gp_dosage(self):
-        self.assertAlmostEqual(hl.eval_expr(hl.gp_dosage([1.0, 0.0, 0.0])), 0.0)
-        self.assertAlmostEqual(hl.eval_expr(hl.gp_dosage([0.0, 1.0, 0.0])), 1.0)
-        self.assertAlmostEqual(hl.eval_expr(hl.gp_dosage([0.0, 0.0, 1.0])), 2.0)
-        self.assertAlmostEqual(hl.eval_expr(hl.gp_dosage([0.5, 0.5, 0.0])), 0.5)
-        self.assertAlmostEqual(hl.eval_expr(hl.gp_dosage([0.0, 0.5, 0.5])), 1.5)
+        gps = hl.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [0.5, 0.5, 0.0], [0.0, 0.5, 0.5]])
+        dosages = hl.eval_expr(gps.map(lambda gp: hl.gp_dosage(gp)))
+        expected_dosages = [0.0, 1.0, 2.0, 0.5, 1.5]
+        self.assertEqual(len(dosages), len(expected_dosages))
+        for dosage, expected in zip(dosages, expected_dosages):
+            self.assertAlmostEqual(dosage, expected)
 
     def test_call(self):
         c2_homref = hl.call(0, 0)
@@ -932,68 +616,73 @@ class Tests(unittest.TestCase):
         c0 = hl.call()
         cNull = hl.null(tcall)
 
-        self.check_expr(c2_homref.ploidy, 2, tint32)
-        self.check_expr(c2_homref[0], 0, tint32)
-        self.check_expr(c2_homref[1], 0, tint32)
-        self.check_expr(c2_homref.phased, False, tbool)
-        self.check_expr(c2_homref.is_hom_ref(), True, tbool)
-
-        self.check_expr(c2_het.ploidy, 2, tint32)
-        self.check_expr(c2_het[0], 1, tint32)
-        self.check_expr(c2_het[1], 0, tint32)
-        self.check_expr(c2_het.phased, True, tbool)
-        self.check_expr(c2_het.is_het(), True, tbool)
-
-        self.check_expr(c2_homvar.ploidy, 2, tint32)
-        self.check_expr(c2_homvar[0], 1, tint32)
-        self.check_expr(c2_homvar[1], 1, tint32)
-        self.check_expr(c2_homvar.phased, False, tbool)
-        self.check_expr(c2_homvar.is_hom_var(), True, tbool)
-        self.check_expr(c2_homvar.unphased_diploid_gt_index(), 2, tint32)
-
-        self.check_expr(c2_hetvar.ploidy, 2, tint32)
-        self.check_expr(c2_hetvar[0], 2, tint32)
-        self.check_expr(c2_hetvar[1], 1, tint32)
-        self.check_expr(c2_hetvar.phased, True, tbool)
-        self.check_expr(c2_hetvar.is_hom_var(), False, tbool)
-        self.check_expr(c2_hetvar.is_het_nonref(), True, tbool)
-
-        self.check_expr(c1.ploidy, 1, tint32)
-        self.check_expr(c1[0], 1, tint32)
-        self.check_expr(c1.phased, False, tbool)
-        self.check_expr(c1.is_hom_var(), True, tbool)
-
-        self.check_expr(c0.ploidy, 0, tint32)
-        self.check_expr(c0.phased, False, tbool)
-        self.check_expr(c0.is_hom_var(), False, tbool)
-
-        self.check_expr(cNull.ploidy, None, tint32)
-        self.check_expr(cNull[0], None, tint32)
-        self.check_expr(cNull.phased, None, tbool)
-        self.check_expr(cNull.is_hom_var(), None, tbool)
-
-        call_expr = hl.call(1, 2, phased=True)
-        self.check_expr(call_expr[0], 1, tint32)
-        self.check_expr(call_expr[1], 2, tint32)
-        self.check_expr(call_expr.ploidy, 2, tint32)
-
-        a0 = hl.literal(1)
+        call_expr_1 = hl.call(1, 2, phased=True)
+
+        a0 = _lit(1)
         a1 = 2
-        phased = hl.literal(True)
-        call_expr = hl.call(a0, a1, phased=phased)
-        self.check_expr(call_expr[0], 1, tint32)
-        self.check_expr(call_expr[1], 2, tint32)
-        self.check_expr(call_expr.ploidy, 2, tint32)
-
-        call_expr = hl.parse_call("1|2")
-        self.check_expr(call_expr[0], 1, tint32)
-        self.check_expr(call_expr[1], 2, tint32)
-        self.check_expr(call_expr.ploidy, 2, tint32)
-
-        call_expr = hl.unphased_diploid_gt_index_call(2)
-        self.check_expr(call_expr[0], 1, tint32)
-        self.check_expr(call_expr[1], 1, tint32)
-        self.check_expr(call_expr.ploidy, 2, tint32)
+        phased = _lit(True)
+        call_expr_2 = hl.call(a0, a1, phased=phased)
+
+        call_expr_3 = hl.parse_call("1|2")
+
+        call_expr_4 = hl.unphased_diploid_gt_index_call(2)
+
+        self.check_exprs([
+            (c2_homref.ploidy, 2, tint32),
+            (c2_homref[0], 0, tint32),
+            (c2_homref[1], 0, tint32),
+            (c2_homref.phased, False, tbool),
+            (c2_homref.is_hom_ref(), True, tbool),
+
+            (c2_het.ploidy, 2, tint32),
+            (c2_het[0], 1, tint32),
+            (c2_het[1], 0, tint32),
+            (c2_het.phased, True, tbool),
+            (c2_het.is_het(), True, tbool),
+
+            (c2_homvar.ploidy, 2, tint32),
+            (c2_homvar[0], 1, tint32),
+            (c2_homvar[1], 1, tint32),
+            (c2_homvar.phased, False, tbool),
+            (c2_homvar.is_hom_var(), True, tbool),
+            (c2_homvar.unphased_diploid_gt_index(), 2, tint32),
+
+            (c2_hetvar.ploidy, 2, tint32),
+            (c2_hetvar[0], 2, tint32),
+            (c2_hetvar[1], 1, tint32),
+            (c2_hetvar.phased, True, tbool),
+            (c2_hetvar.is_hom_var(), False, tbool),
+            (c2_hetvar.is_het_nonref(), True, tbool),
+
+            (c1.ploidy, 1, tint32),
+            (c1[0], 1, tint32),
+            (c1.phased, False, tbool),
+            (c1.is_hom_var(), True, tbool),
+
+            (c0.ploidy, 0, tint32),
+            (c0.phased, False, tbool),
+            (c0.is_hom_var(), False, tbool),
+
+            (cNull.ploidy, None, tint32),
+            (cNull[0], None, tint32),
+            (cNull.phased, None, tbool),
+            (cNull.is_hom_var(), None, tbool),
+
+            (call_expr_1[0], 1, tint32),
+            (call_expr_1[1], 2, tint32),
+            (call_expr_1.ploidy, 2, tint32),
+
+            (call_expr_2[0], 1, tint32),
+            (call_expr_2[1], 2, tint32),
+            (call_expr_2.ploidy, 2, tint32),
+
+            (call_expr_3[0], 1, tint32),
+            (call_expr_3[1], 2, tint32),
+            (call_expr_3.ploidy, 2, tint32),
+
+            (call_expr_4[0], 1, tint32),
+            (call_expr_4[1], 1, tint32),
+            (call_expr_4.ploidy, 2, tint32)])
 
     def test_parse_variant(self):
         self.assertEqual(hl.parse_variant('1:1:A:T').value,
@@ -1022,72 +711,78 @@ class Tests(unittest.TestCase):
                          [([1], 'a', 1)])
 
     def test_array_methods(self):
-        self.assertEqual(hl.eval_expr(hl.any(lambda x: x % 2 == 0, [1, 3, 5])), False)
-        self.assertEqual(hl.eval_expr(hl.any(lambda x: x % 2 == 0, [1, 3, 5, 6])), True)
+        median = hl.median([0, 1, 4, 6])
+        self.check_values([
+            (hl.any(lambda x: x % 2 == 0, [1, 3, 5]), False),
+            (hl.any(lambda x: x % 2 == 0, [1, 3, 5, 6]), True),
 
-        self.assertEqual(hl.eval_expr(hl.all(lambda x: x % 2 == 0, [1, 3, 5, 6])), False)
-        self.assertEqual(hl.eval_expr(hl.all(lambda x: x % 2 == 0, [2, 6])), True)
+            (hl.all(lambda x: x % 2 == 0, [1, 3, 5, 6]), False),
+            (hl.all(lambda x: x % 2 == 0, [2, 6]), True),
 
-        self.assertEqual(hl.eval_expr(hl.find(lambda x: x % 2 == 0, [1, 3, 4, 6])), 4)
-        self.assertEqual(hl.eval_expr(hl.find(lambda x: x % 2 != 0, [0, 2, 4, 6])), None)
+            (hl.find(lambda x: x % 2 == 0, [1, 3, 4, 6]), 4),
+            (hl.find(lambda x: x % 2 != 0, [0, 2, 4, 6]), None),
 
-        self.assertEqual(hl.eval_expr(hl.map(lambda x: x % 2 == 0, [0, 1, 4, 6])), [True, False, True, True])
+            (hl.map(lambda x: x % 2 == 0, [0, 1, 4, 6]), [True, False, True, True]),
 
-        self.assertEqual(hl.eval_expr(hl.len([0, 1, 4, 6])), 4)
+            (hl.len([0, 1, 4, 6]), 4),
 
-        self.assertEqual(hl.eval_expr(hl.max([0, 1, 4, 6])), 6)
+            (hl.max([0, 1, 4, 6]), 6),
 
-        self.assertEqual(hl.eval_expr(hl.min([0, 1, 4, 6])), 0)
+            (hl.min([0, 1, 4, 6]), 0),
 
-        self.assertEqual(hl.eval_expr(hl.mean([0, 1, 4, 6])), 2.75)
+            (hl.mean([0, 1, 4, 6]), 2.75),
 
-        self.assertTrue(1 <= hl.eval_expr(hl.median([0, 1, 4, 6])) <= 4)
+            ((1 <= median) & (median <= 4), True),
 
-        self.assertEqual(hl.eval_expr(hl.product([1, 4, 6])), 24)
+            (hl.product([1, 4, 6]), 24),
 
-        self.assertEqual(hl.eval_expr(hl.group_by(lambda x: x % 2 == 0, [0, 1, 4, 6])), {True: [0, 4, 6], False: [1]})
+            (hl.group_by(lambda x: x % 2 == 0, [0, 1, 4, 6]), {True: [0, 4, 6], False: [1]}),
 
-        self.assertEqual(hl.eval_expr(hl.flatmap(lambda x: hl.range(0, x), [1, 2, 3])), [0, 0, 1, 0, 1, 2])
+            (hl.flatmap(lambda x: hl.range(0, x), [1, 2, 3]), [0, 0, 1, 0, 1, 2])])
 
     def test_bool_r_ops(self):
-        self.assertTrue(hl.eval_expr(hl.literal(True) & True))
-        self.assertTrue(hl.eval_expr(True & hl.literal(True)))
-        self.assertTrue(hl.eval_expr(hl.literal(False) | True))
-        self.assertTrue(hl.eval_expr(True | hl.literal(False)))
+        self.check_values([
+            (_lit(True) & True, True),
+            (True & _lit(True), True),
+            (_lit(False) | True, True),
+            (True | _lit(False), True)])
 
     def test_array_neg(self):
         self.assertEqual(hl.eval_expr(-(hl.literal([1, 2, 3]))), [-1, -2, -3])
 
     def test_min_max(self):
-        self.assertEqual(hl.eval_expr(hl.max(1, 2)), 2)
-        self.assertEqual(hl.eval_expr(hl.max(1.0, 2)), 2.0)
-        self.assertEqual(hl.eval_expr(hl.max([1, 2])), 2)
-        self.assertEqual(hl.eval_expr(hl.max([1.0, 2])), 2.0)
-        self.assertEqual(hl.eval_expr(hl.max(0, 1.0, 2)), 2.0)
-        self.assertEqual(hl.eval_expr(hl.max(0, 1, 2)), 2)
-        self.assertEqual(hl.eval_expr(hl.max([0, 10, 2, 3, 4, 5, 6, ])), 10)
-        self.assertEqual(hl.eval_expr(hl.max(0, 10, 2, 3, 4, 5, 6)), 10)
-
-        self.assertEqual(hl.eval_expr(hl.min(1, 2)), 1)
-        self.assertEqual(hl.eval_expr(hl.min(1.0, 2)), 1.0)
-        self.assertEqual(hl.eval_expr(hl.min([1, 2])), 1)
-        self.assertEqual(hl.eval_expr(hl.min([1.0, 2])), 1.0)
-        self.assertEqual(hl.eval_expr(hl.min(0, 1.0, 2)), 0.0)
-        self.assertEqual(hl.eval_expr(hl.min(0, 1, 2)), 0)
-        self.assertEqual(hl.eval_expr(hl.min([0, 10, 2, 3, 4, 5, 6, ])), 0)
-        self.assertEqual(hl.eval_expr(hl.min(4, 10, 2, 3, 4, 5, 6)), 2)
+        self.check_values([
+            (hl.max(1, 2), 2),
+            (hl.max(1.0, 2), 2.0),
+            (hl.max([1, 2]), 2),
+            (hl.max([1.0, 2]), 2.0),
+            (hl.max(0, 1.0, 2), 2.0),
+            (hl.max(0, 1, 2), 2),
+            (hl.max([0, 10, 2, 3, 4, 5, 6, ]), 10),
+            (hl.max(0, 10, 2, 3, 4, 5, 6), 10),
+
+            (hl.min(1, 2), 1),
+            (hl.min(1.0, 2), 1.0),
+            (hl.min([1, 2]), 1),
+            (hl.min([1.0, 2]), 1.0),
+            (hl.min(0, 1.0, 2), 0.0),
+            (hl.min(0, 1, 2), 0),
+            (hl.min([0, 10, 2, 3, 4, 5, 6, ]), 0),
+            (hl.min(4, 10, 2, 3, 4, 5, 6), 2)])
 
     def test_abs(self):
-        self.assertEqual(hl.eval_expr(hl.abs(-5)), 5)
-        self.assertEqual(hl.eval_expr(hl.abs(-5.5)), 5.5)
-        self.assertEqual(hl.eval_expr(hl.abs(5.5)), 5.5)
-        self.assertEqual(hl.eval_expr(hl.abs([5.5, -5.5])), [5.5, 5.5])
+        self.check_values([
+            (hl.abs(-5), 5),
+            (hl.abs(-5.5), 5.5),
+            (hl.abs(5.5), 5.5),
+            (hl.abs([5.5, -5.5]), [5.5, 5.5])])
 
     def test_signum(self):
-        self.assertEqual(hl.eval_expr(hl.signum(-5)), -1)
-        self.assertEqual(hl.eval_expr(hl.signum(0.0)), 0)
-        self.assertEqual(hl.eval_expr(hl.signum(10.0)), 1)
-        self.assertEqual(hl.eval_expr(hl.signum([-5, 0, 10])), [-1, 0, 1])
+        self.check_values([
+            (hl.signum(-5), -1),
+            (hl.signum(0.0), 0),
+            (hl.signum(10.0), 1),
+            (hl.signum([-5, 0, 10]), [-1, 0, 1])])
 
     def test_argmin_and_argmax(self):
         a = hl.array([2, 1, 1, 4, 4, 3])
@@ -1109,40 +804,41 @@ class Tests(unittest.TestCase):
 
         t = hl.tuple([1, t1, hl.dict(hl.zip(["a", "b"], [t2, t2])), [1, 5], tn1])
 
-        self.assertTrue(hl.eval_expr(t[0]) == 1)
-        self.assertTrue(hl.eval_expr(t[1][0]) == 1)
-        self.assertTrue(hl.eval_expr(t[2]["a"]) == (1, "hello"))
-        self.assertTrue(hl.eval_expr(t[2]["b"][1]) == "hello")
-        self.assertTrue(hl.eval_expr(t[3][1]) == 5)
-        self.assertTrue(hl.eval_expr(t[4][1][1][1]) == 4)
+        self.check_values([
+            (t[0], 1),
+            (t[1][0], 1),
+            (t[2]["a"], (1, "hello")),
+            (t[2]["b"][1], "hello"),
+            (t[3][1], 5),
+            (t[4][1][1][1], 4),
 
-        self.assertTrue(hl.eval_expr(hl.len(t0) == 0))
-        self.assertTrue(hl.eval_expr(hl.len(t2) == 2))
-        self.assertTrue(hl.eval_expr(hl.len(t)) == 5)
+            (hl.len(t0) == 0, True),
+            (hl.len(t2) == 2, True),
+            (hl.len(t), 5)])
 
     def test_interval_ops(self):
         interval = hl.interval(3, 6)
-        self.assertTrue(hl.eval_expr_typed(interval.start) == (3, hl.tint))
-        self.assertTrue(hl.eval_expr_typed(interval.end) == (6, hl.tint))
-        self.assertTrue(hl.eval_expr_typed(interval.includes_start) == (True, hl.tbool))
-        self.assertTrue(hl.eval_expr_typed(interval.includes_end) == (False, hl.tbool))
-        self.assertTrue(hl.eval_expr_typed(interval.contains(5)) == (True, hl.tbool))
-        self.assertTrue(hl.eval_expr_typed(interval.overlaps(hl.interval(5, 9))) == (True, hl.tbool))
+        self.check_exprs([
+            (interval.start, 3, hl.tint),
+            (interval.end, 6, hl.tint),
+            (interval.includes_start, True, hl.tbool),
+            (interval.includes_end, False, hl.tbool),
+            (interval.contains(5), True, hl.tbool),
+            (interval.overlaps(hl.interval(5, 9)), True, hl.tbool)])
 
         li = hl.parse_locus_interval('1:100-110')
-        self.assertEqual(li.value, hl.utils.Interval(hl.genetics.Locus("1", 100),
-                                                     hl.genetics.Locus("1", 110)))
-        self.assertTrue(li.dtype.point_type == hl.tlocus())
-        self.assertTrue(li.contains(hl.locus("1", 100)).value)
-        self.assertTrue(li.contains(hl.locus("1", 109)).value)
-        self.assertFalse(li.contains(hl.locus("1", 110)).value)
-    
         li2 = hl.parse_locus_interval("1:109-200")
         li3 = hl.parse_locus_interval("1:110-200")
         li4 = hl.parse_locus_interval("1:90-101")
         li5 = hl.parse_locus_interval("1:90-100")
-    
-        self.assertTrue(li.overlaps(li2).value)
-        self.assertTrue(li.overlaps(li4).value)
-        self.assertFalse(li.overlaps(li3).value)
-        self.assertFalse(li.overlaps(li5).value)
+
+        self.assertTrue(li.dtype.point_type == hl.tlocus())
+        self.check_values([
+            (li, hl.utils.Interval(hl.genetics.Locus("1", 100), hl.genetics.Locus("1", 110))),
+            (li.contains(hl.locus("1", 100)), True),
+            (li.contains(hl.locus("1", 109)), True),
+            (li.contains(hl.locus("1", 110)), False),
+            (li.overlaps(li2), True),
+            (li.overlaps(li4), True),
+            (li.overlaps(li3), False),
+            (li.overlaps(li5), False)])
@@ -6,8 +6,10 @@ from subprocess import DEVNULL, call as syscall
 import numpy as np
 from struct import unpack
 import hail.utils as utils
+from hail.utils.java import Env
 from hail.linalg import BlockMatrix
 from math import sqrt
+from pyspark.sql.utils import AnalysisException
 from .utils import resource, doctest_resource, startTestHailContext, stopTestHailContext
 
 setUpModule = startTestHailContext
@@ -447,6 +449,20 @@ class Tests(unittest.TestCase):
         metadata_imported = hl.get_vcf_metadata('/tmp/sample.vcf')
         self.assertDictEqual(vcf_metadata, metadata_imported)
 
+    def test_export_parquet(self):
+        dataset = self.get_dataset()
+        parquet_file = utils.new_temp_file(prefix="export", suffix="parquet")
+        hl.export_parquet(dataset, parquet_file)
+
+        df = Env.sql_context().read.parquet(parquet_file)
+        self.assertEqual(df.count(), dataset.count_rows())
+        self.assertTrue('locus.contig' in df.columns)
+        self.assertEqual(len(df.select('entries').first()[0]), dataset.count_cols())
+
+        with self.assertRaises(AnalysisException):
+            hl.export_parquet(dataset, parquet_file)
+        hl.export_parquet(dataset, parquet_file, overwrite=True)
+
     def test_concordance(self):
         dataset = self.get_dataset()
         glob_conc, cols_conc, rows_conc = hl.concordance(dataset, dataset)
@@ -1,10 +1,20 @@
+import atexit
 import os
 import sys
 import hail
+from hail.utils.java import Env
+
+_stop_registered = False
 
 
 def startTestHailContext():
-    hail.init(master='local[2]', min_block_size=0, quiet=True)
+    # a module that leaves the context running shares it with later modules; it is stopped at exit at the latest
+    global _stop_registered
+    if Env._hc is None:
+        hail.init(master='local[2]', min_block_size=0, quiet=True)
+    if not _stop_registered:
+        atexit.register(stopTestHailContext)
+        _stop_registered = True
 
 
 def stopTestHailContext():
@@ -373,6 +373,26 @@ numeric = oneof(int, float)
 
 char = CharChecker()
 
+def check_signature(f, spec, named_args, checks):
+    name = f.__name__
+    signature_namespace = set(named_args).union(spec.kwonlyargs).union(
+        set(filter(lambda x: x is not None, [spec.varargs, spec.varkw])))
+    tc_namespace = set(checks.keys())
+
+    if signature_namespace != tc_namespace:
+        unmatched_tc = list(tc_namespace - signature_namespace)
+        unmatched_sig = list(signature_namespace - tc_namespace)
+        if unmatched_sig or unmatched_tc:
+            msg = ''
+            if unmatched_tc:
+                msg += 'unmatched typecheck arguments: %s' % unmatched_tc
+            if unmatched_sig:
+                if msg:
+                    msg += ', and '
+                msg += 'function parameters with no defined type: %s' % unmatched_sig
+            raise RuntimeError('%s: invalid typecheck signature: %s' % (name, msg))
+
+
 def check_all(f, args, kwargs, checks, is_method):
     if not hasattr(f, '_cached_spec'):
         setattr(f, '_cached_spec', inspect.getfullargspec(f))
@@ -394,33 +414,29 @@ def check_all(f, args, kwargs, checks, is_method):
         named_args = spec.args[:]
         pos_args = args[:]
 
-    signature_namespace = set(named_args).union(spec.kwonlyargs).union(
-        set(filter(lambda x: x is not None, [spec.varargs, spec.varkw])))
-    tc_namespace = set(checks.keys())
+    # ensure that the typecheck signature is appropriate and matches the function signature, and bind the
+    # checkers to parameter positions; this only depends on the function and its checkers, so it is done on
+    # the first call only
+    if not hasattr(f, '_named_checkers'):
+        check_signature(f, spec, named_args, checks)
+        setattr(f, '_named_checkers', [checks[argname] for argname in named_args])
 
-    # ensure that the typecheck signature is appropriate and matches the function signature
-    if signature_namespace != tc_namespace:
-        unmatched_tc = list(tc_namespace - signature_namespace)
-        unmatched_sig = list(signature_namespace - tc_namespace)
-        if unmatched_sig or unmatched_tc:
-            msg = ''
-            if unmatched_tc:
-                msg += 'unmatched typecheck arguments: %s' % unmatched_tc
-            if unmatched_sig:
-                if msg:
-                    msg += ', and '
-                msg += 'function parameters with no defined type: %s' % unmatched_sig
-            raise RuntimeError('%s: invalid typecheck signature: %s' % (name, msg))
+    named_checkers = f._named_checkers
+    n_named = len(named_args)
 
     for i in range(len(pos_args)):
         arg = pos_args[i]
-        argname = named_args[i] if i < len(named_args) else spec.varargs
-        tc = checks[argname]
+        if i < n_named:
+            argname = named_args[i]
+            tc = named_checkers[i]
+        else:
+            argname = spec.varargs
+            tc = checks[argname]
         try:
             arg_ = tc.check(arg, name, argname)
             args_.append(arg_)
         except TypecheckFailure:
-            if i < len(named_args):
+            if i < n_named:
                 raise TypeError("{fname}: parameter '{argname}': "
                                 "expected {expected}, found {found}".format(
                     fname=name,
@@ -433,8 +449,8 @@ def check_all(f, args, kwargs, checks, is_method):
                                 "expected {expected}, found {found}".format(
                     fname=name,
                     argname=argname,
-                    idx=i - len(named_args),
-                    tot=len(pos_args) - len(named_args),
+                    idx=i - n_named,
+                    tot=len(pos_args) - n_named,
                     expected=tc.expects(),
                     found=tc.format(arg)
                 )) from None
@@ -2,6 +2,7 @@ import socketserver
 import socket
 import sys
 import re
+import json
 from threading import Thread
 
 import py4j
@@ -18,6 +19,8 @@ class Env:
     _jutils = None
     _hc = None
     _counter = 0
+    _jnone = None
+    _jempty_set = None
 
     @staticmethod
     def get_uid():
@@ -91,7 +94,10 @@ def scala_package_object(jpackage):
 
 
 def jnone():
-    return scala_object(Env.jvm().scala, 'None')
+    # scala.None is a singleton, so look it up once rather than on every optional argument
+    if Env._jnone is None:
+        Env._jnone = scala_object(Env.jvm().scala, 'None')
+    return Env._jnone
 
 
 def jsome(x):
@@ -115,15 +121,25 @@ def jset(x):
 
 
 def jindexed_seq_args(x):
-    args = [x] if isinstance(x, str) else x
-    return jindexed_seq(args)
+    if isinstance(x, str):
+        return Env.jutils().stringToISeq(x)
+    return jindexed_seq(x)
 
 
 def jset_args(x):
     args = [x] if isinstance(x, str) else x
+    if not args:
+        # the empty set is immutable, so reuse one rather than marshalling an empty list per call
+        if Env._jempty_set is None:
+            Env._jempty_set = jset([])
+        return Env._jempty_set
     return jset(args)
 
 
+def jstr_map(x):
+    return Env.jutils().parseStringMapJSON(json.dumps(x))
+
+
 def jiterable_to_list(it):
     if it:
         return list(Env.jutils().iterableToArrayList(it))
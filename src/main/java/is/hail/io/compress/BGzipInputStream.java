@@ -6,7 +6,10 @@ import org.apache.hadoop.io.compress.SplittableCompressionCodec;
 import java.io.ByteArrayInputStream;
 import java.io.IOException;
 import java.io.InputStream;
+import java.util.zip.CRC32;
+import java.util.zip.DataFormatException;
 import java.util.zip.GZIPInputStream;
+import java.util.zip.Inflater;
 import java.util.zip.ZipException;
 
 public class BGzipInputStream extends SplitCompressionInputStream {
@@ -23,6 +26,10 @@ public class BGzipInputStream extends SplitCompressionInputStream {
 
         int isize = 0;
 
+        int flg = 0;
+
+        int xlen = 0;
+
         public int getBlockSize() { return bsize; }
 
         public BGzipHeader(byte[] buf, int off, int bufSize) throws ZipException {
@@ -35,11 +42,11 @@ public class BGzipInputStream extends SplitCompressionInputStream {
                 throw new ZipException(ZIP_EXCEPTION_MESSAGE);
 
             // FEXTRA set
-            int flg = (buf[off + 3] & 0xff);
+            flg = (buf[off + 3] & 0xff);
             if ((flg & 4) != 4)
                 throw new ZipException(ZIP_EXCEPTION_MESSAGE);
 
-            int xlen = (buf[off + 10] & 0xff) | ((buf[off + 11] & 0xff) << 8);
+            xlen = (buf[off + 10] & 0xff) | ((buf[off + 11] & 0xff) << 8);
             if (xlen < 6
                 || off + 12 + xlen > bufSize)
                 throw new ZipException(ZIP_EXCEPTION_MESSAGE);
@@ -95,6 +102,11 @@ public class BGzipInputStream extends SplitCompressionInputStream {
 
     long currentPos;
 
+    /* Reused for every block: constructing a GZIPInputStream per block allocates a new native zlib stream
+       and re-parses the gzip header that BGzipHeader has already validated. */
+    final Inflater inflater = new Inflater(true);
+    final CRC32 crc = new CRC32();
+
     public BGzipInputStream(InputStream in, long start, long end, SplittableCompressionCodec.READ_MODE readMode) throws IOException {
         super(in, start, end);
 
@@ -155,17 +167,59 @@ public class BGzipInputStream extends SplitCompressionInputStream {
             return;
         }
 
-        InputStream decompIS
-                = new GZIPInputStream(new ByteArrayInputStream(inputBuffer, 0, bsize));
+        if (bgzipHeader.flg == 4)
+            inflateBlock(bsize, isize);
+        else {
+            // optional gzip header fields are present, let GZIPInputStream skip them
+            InputStream decompIS
+                    = new GZIPInputStream(new ByteArrayInputStream(inputBuffer, 0, bsize));
 
-        while (outputBufferSize < isize) {
-            int result = decompIS.read(outputBuffer, outputBufferSize, isize - outputBufferSize);
-            if (result < 0)
-                throw new ZipException(ZIP_EXCEPTION_MESSAGE);
-            outputBufferSize += result;
+            while (outputBufferSize < isize) {
+                int result = decompIS.read(outputBuffer, outputBufferSize, isize - outputBufferSize);
+                if (result < 0)
+                    throw new ZipException(ZIP_EXCEPTION_MESSAGE);
+                outputBufferSize += result;
+            }
+
+            decompIS.close();
         }
+    }
+
+    /* Inflates the raw deflate data of the block at the start of `inputBuffer' and checks it against the CRC32 in
+       the gzip trailer, as GZIPInputStream does. */
+    private void inflateBlock(int bsize, int isize) throws IOException {
+        int dataOff = 12 + bgzipHeader.xlen;
+        int dataLen = bsize - dataOff - 8;
+        if (dataLen < 0)
+            throw new ZipException(ZIP_EXCEPTION_MESSAGE);
+
+        inflater.reset();
+        inflater.setInput(inputBuffer, dataOff, dataLen);
+        try {
+            while (outputBufferSize < isize) {
+                int result = inflater.inflate(outputBuffer, outputBufferSize, isize - outputBufferSize);
+                if (result == 0 && (inflater.finished() || inflater.needsInput() || inflater.needsDictionary()))
+                    throw new ZipException(ZIP_EXCEPTION_MESSAGE);
+                outputBufferSize += result;
+            }
+        } catch (DataFormatException e) {
+            throw new ZipException(ZIP_EXCEPTION_MESSAGE);
+        }
+
+        int expectedCrc = ((inputBuffer[bsize - 8] & 0xff)
+                | ((inputBuffer[bsize - 7] & 0xff) << 8)
+                | ((inputBuffer[bsize - 6] & 0xff) << 16)
+                | ((inputBuffer[bsize - 5] & 0xff) << 24));
+        crc.reset();
+        crc.update(outputBuffer, 0, outputBufferSize);
+        if ((int) crc.getValue() != expectedCrc)
+            throw new ZipException(ZIP_EXCEPTION_MESSAGE);
+    }
 
-        decompIS.close();
+    @Override
+    public void close() throws IOException {
+        inflater.end();
+        super.close();
     }
 
     public long blockPos() {
@@ -65,6 +65,10 @@ object HailContext {
 
     conf.set("spark.hadoop.mapreduce.input.fileinputformat.split.minsize", (blockSize * 1024L * 1024L).toString)
 
+    // Hadoop's default of 4 KiB sizes both the file system read buffers and the LineRecordReader buffer that
+    // import_vcf, import_table, import_gen and import_matrix_table read through
+    conf.set("spark.hadoop.io.file.buffer.size", inputBufferSize.toString)
+
     // load additional Spark properties from HAIL_SPARK_PROPERTIES
     val hailSparkProperties = System.getenv("HAIL_SPARK_PROPERTIES")
     if (hailSparkProperties != null) {
@@ -235,9 +239,21 @@ class HailContext private(val sc: SparkContext,
   def version: String = is.hail.HAIL_PRETTY_VERSION
 
   def grep(regex: String, files: Seq[String], maxLines: Int = 100) {
-    val regexp = regex.r
+    // fail fast on the driver for an invalid pattern
+    regex.r
+
+    // patterns without metacharacters are plain substring searches, which skip the regex engine
+    val isLiteral = !regex.exists(c => "\\^$.|?*+()[]{}".indexOf(c) >= 0)
+
     sc.textFilesLines(hadoopConf.globAll(files))
-      .filter(line => regexp.findFirstIn(line.value).isDefined)
+      .mapPartitions { it =>
+        if (isLiteral)
+          it.filter(line => line.value.contains(regex))
+        else {
+          val matcher = java.util.regex.Pattern.compile(regex).matcher("")
+          it.filter(line => matcher.reset(line.value).find())
+        }
+      }
       .take(maxLines)
       .groupBy(_.source.asInstanceOf[Context].file)
       .foreach { case (file, lines) =>
@@ -296,14 +312,26 @@ class HailContext private(val sc: SparkContext,
       nPartitions, rg, contigRecoding.getOrElse(Map.empty[String, String]), tolerance)
   }
 
+  // no reference genome; spares Python building a scala.None over Py4J
+  def importBgens(files: Seq[String],
+    sampleFile: Option[String],
+    includeGT: Boolean,
+    includeGP: Boolean,
+    includeDosage: Boolean,
+    nPartitions: Option[Int],
+    contigRecoding: Option[Map[String, String]],
+    tolerance: Double): MatrixTable =
+    importBgens(files, sampleFile, includeGT, includeGP, includeDosage, nPartitions, None, contigRecoding, tolerance)
+
   def importGen(file: String,
     sampleFile: String,
     chromosome: Option[String] = None,
     nPartitions: Option[Int] = None,
     tolerance: Double = 0.2,
     rg: Option[ReferenceGenome] = Some(ReferenceGenome.defaultReference),
-    contigRecoding: Option[Map[String, String]] = None): MatrixTable = {
-    importGens(List(file), sampleFile, chromosome, nPartitions, tolerance, rg, contigRecoding)
+    contigRecoding: Option[Map[String, String]] = None,
+    forceBGZ: Boolean = false): MatrixTable = {
+    importGens(List(file), sampleFile, chromosome, nPartitions, tolerance, rg, contigRecoding, forceBGZ)
   }
 
   def importGens(files: Seq[String],
@@ -312,7 +340,8 @@ class HailContext private(val sc: SparkContext,
     nPartitions: Option[Int] = None,
     tolerance: Double = 0.2,
     rg: Option[ReferenceGenome] = Some(ReferenceGenome.defaultReference),
-    contigRecoding: Option[Map[String, String]] = None): MatrixTable = {
+    contigRecoding: Option[Map[String, String]] = None,
+    forceBGZ: Boolean = false): MatrixTable = {
     val inputs = hadoopConf.globAll(files)
 
     inputs.foreach { input =>
@@ -320,6 +349,15 @@ class HailContext private(val sc: SparkContext,
         fatal(s"gen inputs must end in .gen[.bgz], found $input")
     }
 
+    if (!forceBGZ) {
+      val gzInputs = inputs.filter(_.endsWith(".gz"))
+      if (gzInputs.nonEmpty)
+        warn(s"""${ plural(gzInputs.length, "gen input is", "gen inputs are") } .gz and will be read serially, one partition per file:
+                |  @1
+                |If these files are actually block gzipped, use force_bgz=True to load them in parallel.""".stripMargin,
+          gzInputs.truncatable("\n  "))
+    }
+
     if (inputs.isEmpty)
       fatal(s"arguments refer to no files: ${ files.mkString(",") }")
 
@@ -329,8 +367,10 @@ class HailContext private(val sc: SparkContext,
     val nSamples = samples.length
 
     //FIXME: can't specify multiple chromosomes
-    val results = inputs.map(f => LoadGen(f, sampleFile, sc, rg, nPartitions,
-      tolerance, chromosome, contigRecoding.getOrElse(Map.empty[String, String])))
+    val results = forceBGZip(forceBGZ) {
+      inputs.map(f => LoadGen(f, sampleFile, sc, rg, nPartitions,
+        tolerance, chromosome, contigRecoding.getOrElse(Map.empty[String, String])))
+    }
 
     val unequalSamples = results.filter(_.nSamples != nSamples).map(x => (x.file, x.nSamples))
     if (unequalSamples.length > 0)
@@ -371,6 +411,15 @@ class HailContext private(val sc: SparkContext,
       rdd)
   }
 
+  def importGens(files: Seq[String],
+    sampleFile: String,
+    chromosome: Option[String],
+    nPartitions: Option[Int],
+    tolerance: Double,
+    contigRecoding: Option[Map[String, String]],
+    forceBGZ: Boolean): MatrixTable =
+    importGens(files, sampleFile, chromosome, nPartitions, tolerance, None, contigRecoding, forceBGZ)
+
   def importTable(inputs: java.util.ArrayList[String],
     keyNames: java.util.ArrayList[String],
     nPartitions: java.lang.Integer,
@@ -389,6 +389,20 @@ object TableAnnotationImpex extends AnnotationImpex[Unit, String] {
     }
   }
 
+  /**
+    * Resolves the type dispatch of {@code importAnnotation} once, for callers that convert many values of the
+    * same type, such as a column of a text table.
+    */
+  def importer(t: Type): String => Annotation = t match {
+    case _: TString => a => a
+    case _: TInt32 => a => a.toInt
+    case _: TInt64 => a => a.toLong
+    case _: TFloat32 => a => a.toFloat
+    case _: TFloat64 => a => if (a == "nan") Double.NaN else a.toDouble
+    case _: TBoolean => a => a.toBoolean
+    case _ => a => importAnnotation(a, t)
+  }
+
   def importAnnotation(a: String, t: Type): Annotation = {
     (t: @unchecked) match {
       case _: TString => a
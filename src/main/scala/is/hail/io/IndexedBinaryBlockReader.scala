@@ -1,6 +1,7 @@
 package is.hail.io
 
 import is.hail.annotations.RegionValueBuilder
+import is.hail.utils._
 import org.apache.commons.logging.{Log, LogFactory}
 import org.apache.hadoop.conf.Configuration
 import org.apache.hadoop.fs.{FileSystem, Path}
@@ -36,7 +37,7 @@ abstract class IndexedBinaryBlockReader[T](job: Configuration, split: FileSplit)
   def openFile(): HadoopFSDataBinaryReader = {
     val file: Path = split.getPath
     val fs: FileSystem = file.getFileSystem(job)
-    new HadoopFSDataBinaryReader(fs.open(file))
+    new HadoopFSDataBinaryReader(fs.open(file, inputBufferSize))
   }
 
   def seekToFirstBlockInSplit(start: Long): Unit
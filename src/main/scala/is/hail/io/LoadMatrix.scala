@@ -19,12 +19,14 @@ class LoadMatrixParser(rvb: RegionValueBuilder, fieldTypes: Array[Type], entryTy
   val sep = '\t'
   val nFields: Int = fieldTypes.length
   val cellf: (String, Long, Int, Int) => Int = addType(entryType.types(0))
+  // resolved once: addType matches on the type and allocates a new function value on each call
+  val rowFieldfs: Array[(String, Long, Int, Int) => Int] = fieldTypes.map(addType)
 
   def parseLine(line: String, rowNum: Long): Unit = {
     var ii = 0
     var off = 0
-    while (ii < fieldTypes.length) {
-      off = addType(fieldTypes(ii))(line, rowNum, ii, off)
+    while (ii < nFields) {
+      off = rowFieldfs(ii)(line, rowNum, ii, off)
       ii += 1
       if (off > line.length) {
         fatal(
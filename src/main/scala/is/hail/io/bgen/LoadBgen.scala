@@ -8,6 +8,7 @@ import is.hail.io.{HadoopFSDataBinaryReader, IndexBTree}
 import is.hail.rvd.OrderedRVD
 import is.hail.utils._
 import is.hail.variant._
+import org.apache.hadoop.fs.Path
 import org.apache.hadoop.io.LongWritable
 import org.apache.spark.rdd.RDD
 import org.apache.spark.sql.Row
@@ -35,6 +36,8 @@ object LoadBgen {
     require(files.nonEmpty)
     val hadoop = hc.hadoopConf
 
+    checkIndexes(hadoop, files)
+
     val sampleIds = sampleFile.map(file => LoadBgen.readSampleFile(hadoop, file))
       .getOrElse(LoadBgen.readSamples(hadoop, files.head))
 
@@ -103,6 +106,8 @@ object LoadBgen {
     val kType = matrixType.orvdType.kType
     val rowType = matrixType.rvRowType
 
+    val contigRecodingBc = sc.broadcast(contigRecoding)
+
     val fastKeys = sc.union(results.map(_.rdd.mapPartitions { it =>
       val region = Region()
       val rvb = new RegionValueBuilder(region)
@@ -110,7 +115,7 @@ object LoadBgen {
 
       it.map { case (_, record) =>
         val (contig, pos, alleles) = record.getKey
-        val contigRecoded = contigRecoding.getOrElse(contig, contig)
+        val contigRecoded = contigRecodingBc.value.getOrElse(contig, contig)
 
         region.clear()
         rvb.start(kType)
@@ -141,7 +146,7 @@ object LoadBgen {
         val (contig, pos, alleles) = record.getKey
         val va = record.getAnnotation.asInstanceOf[Row]
 
-        val contigRecoded = contigRecoding.getOrElse(contig, contig)
+        val contigRecoded = contigRecodingBc.value.getOrElse(contig, contig)
 
         region.clear()
         rvb.start(rowType)
@@ -172,6 +177,22 @@ object LoadBgen {
       OrderedRVD(matrixType.orvdType, rdd2, Some(fastKeys), None))
   }
 
+  /**
+    * Lists each parent directory once rather than issuing one exists call per index file, which matters for
+    * globs over thousands of shards on object stores.
+    */
+  def checkIndexes(hConf: org.apache.hadoop.conf.Configuration, files: Array[String]) {
+    val missing = files.groupBy(file => new Path(file).getParent.toString).flatMap { case (dir, dirFiles) =>
+      val present = hConf.listStatus(dir).map(_.getPath.getName).toSet
+      dirFiles.filter(file => !present.contains(new Path(file).getName + ".idx"))
+    }
+
+    if (missing.nonEmpty)
+      fatal(
+        s"""The following BGEN files have no index file. Create one with 'index_bgen':
+           |  ${ missing.mkString("\n  ") }""".stripMargin)
+  }
+
   def index(hConf: org.apache.hadoop.conf.Configuration, file: String) {
     val indexFile = file + ".idx"
 
@@ -186,20 +207,31 @@ object LoadBgen {
       val reader = new HadoopFSDataBinaryReader(is)
       reader.seek(0)
 
-      for (i <- 1 to bState.nVariants) {
+      // only the record lengths matter here, so seek past the identifier and allele strings instead of decoding them
+      def skipLengthAndString(lengthBytes: Int) {
+        val length = if (lengthBytes == 2) reader.readShort() else reader.readInt()
+        reader.seek(reader.getPosition + (length & 0xffffffffL))
+      }
+
+      var i = 1
+      while (i <= bState.nVariants) {
         reader.seek(position)
 
         if (bState.version == 1)
           reader.readInt() // nRows for v1.1 only
 
-        val snpid = reader.readLengthAndString(2)
-        val rsid = reader.readLengthAndString(2)
-        val chr = reader.readLengthAndString(2)
-        val pos = reader.readInt()
+        skipLengthAndString(2) // snpid
+        skipLengthAndString(2) // rsid
+        skipLengthAndString(2) // chr
+        reader.readInt() // pos
 
         val nAlleles = if (bState.version == 2) reader.readShort() else 2
-        assert(nAlleles >= 2, s"Number of alleles must be greater than or equal to 2. Found $nAlleles alleles for variant '$snpid'")
-        (0 until nAlleles).foreach { i => reader.readLengthAndString(4) }
+        assert(nAlleles >= 2, s"Number of alleles must be greater than or equal to 2. Found $nAlleles alleles for variant at offset $position")
+        var j = 0
+        while (j < nAlleles) {
+          skipLengthAndString(4)
+          j += 1
+        }
 
         position = bState.version match {
           case 1 =>
@@ -212,6 +244,7 @@ object LoadBgen {
         }
 
         dataBlockStarts(i) = position
+        i += 1
       }
     }
 
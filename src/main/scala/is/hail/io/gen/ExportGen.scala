@@ -71,11 +71,11 @@ object ExportGen {
             view.setGenotype(i)
             if (view.hasGP) {
               sb += ' '
-              sb.append(formatDouble(view.getGP(0), precision))
+              sb.appendFixed(view.getGP(0), precision)
               sb += ' '
-              sb.append(formatDouble(view.getGP(1), precision))
+              sb.appendFixed(view.getGP(1), precision)
               sb += ' '
-              sb.append(formatDouble(view.getGP(2), precision))
+              sb.appendFixed(view.getGP(2), precision)
             } else
               sb.append(" 0 0 0")
             i += 1
@@ -24,14 +24,60 @@ object LoadGen {
 
     val nSamples = sampleIds.length
 
+    val contigRecodingBc = sc.broadcast(contigRecoding)
+
     val rdd = sc.textFileLines(genFile, nPartitions.getOrElse(sc.defaultMinPartitions))
       .map(_.map { l =>
-        readGenLine(l, nSamples, tolerance, rg, chromosome, contigRecoding)
+        readGenLine(l, nSamples, tolerance, rg, chromosome, contigRecodingBc.value)
       }.value)
 
     GenResult(genFile, nSamples, rdd.count().toInt, rdd = rdd)
   }
 
+  // 10^i is exact as a Double for i <= 22
+  private val exactPowersOfTen: Array[Double] = {
+    val a = new Array[Double](16)
+    a(0) = 1.0
+    var i = 1
+    while (i < a.length) {
+      a(i) = a(i - 1) * 10
+      i += 1
+    }
+    a
+  }
+
+  // GEN probabilities are almost always plain decimals like "0", "1" or "0.9837". With at most 15 digits the
+  // digits form an exact Long m and the value is m / 10^(fraction digits), a single correctly rounded division,
+  // so the result is the same as String.toDouble. Anything else (signs, exponents, longer digit strings) falls
+  // back to String.toDouble.
+  def parseGenProb(s: String): Double = {
+    val n = s.length
+    var m = 0L
+    var nDigits = 0
+    var fracDigits = -1
+    var i = 0
+    while (i < n) {
+      val c = s(i)
+      if (c >= '0' && c <= '9') {
+        m = m * 10 + (c - '0')
+        nDigits += 1
+        if (fracDigits >= 0)
+          fracDigits += 1
+      } else if (c == '.' && fracDigits < 0)
+        fracDigits = 0
+      else
+        return s.toDouble
+      i += 1
+    }
+
+    if (nDigits == 0 || nDigits > 15)
+      s.toDouble
+    else if (fracDigits <= 0)
+      m.toDouble
+    else
+      m / exactPowersOfTen(fracDigits)
+  }
+
   def readGenLine(line: String, nSamples: Int,
     tolerance: Double,
     rg: Option[ReferenceGenome],
@@ -51,34 +97,44 @@ object LoadGen {
     val locus = Locus.annotation(recodedContig, start.toInt, rg)
     val alleles = Array(ref, alt).toFastIndexedSeq
 
-    val gp = arr.drop(6 - chrCol).map {
-      _.toDouble
-    }
-
-    if (gp.length != (3 * nSamples))
+    val gpStart = 6 - chrCol
+    if (arr.length - gpStart != (3 * nSamples))
       fatal("Number of genotype probabilities does not match 3 * number of samples. If no chromosome column is included, use -c to input the chromosome.")
 
-    val gsb = new ArrayBuilder[Annotation]()
-
-    for (i <- gp.indices by 3) {
-      val d0 = gp(i)
-      val d1 = gp(i + 1)
-      val d2 = gp(i + 2)
-      val sumDosages = d0 + d1 + d2
+    // parse every probability first, then normalize in a separate arithmetic-only pass over the packed array
+    val probs = new Array[Double](3 * nSamples)
+    var i = 0
+    while (i < probs.length) {
+      probs(i) = parseGenProb(arr(gpStart + i))
+      i += 1
+    }
 
-      val a =
-        if (math.abs(sumDosages - 1.0) <= tolerance) {
-          val gp = Array(d0 / sumDosages, d1 / sumDosages, d2 / sumDosages)
-          val gt = Genotype.unboxedGTFromLinear(gp)
-          Annotation(if (gt != -1) Call2.fromUnphasedDiploidGtIndex(gt) else null, gp: IndexedSeq[Double])
-        } else
-          null
+    val sums = new Array[Double](nSamples)
+    var j = 0
+    while (j < nSamples) {
+      val k = 3 * j
+      val sumDosages = probs(k) + probs(k + 1) + probs(k + 2)
+      sums(j) = sumDosages
+      probs(k) /= sumDosages
+      probs(k + 1) /= sumDosages
+      probs(k + 2) /= sumDosages
+      j += 1
+    }
 
-      gsb += a
+    val gs = new Array[Annotation](nSamples)
+    j = 0
+    while (j < nSamples) {
+      if (math.abs(sums(j) - 1.0) <= tolerance) {
+        val k = 3 * j
+        val gp = Array(probs(k), probs(k + 1), probs(k + 2))
+        val gt = Genotype.unboxedGTFromLinear(gp)
+        gs(j) = Annotation(if (gt != -1) Call2.fromUnphasedDiploidGtIndex(gt) else null, gp: IndexedSeq[Double])
+      }
+      j += 1
     }
 
     val annotations = Annotation(locus, alleles, rsid, varid)
 
-    (annotations, gsb.result())
+    (annotations, gs)
   }
 }
@@ -0,0 +1,68 @@
+package is.hail.io.hadoop
+
+import java.io.{BufferedOutputStream, DataOutputStream, OutputStream}
+
+import is.hail.utils._
+import org.apache.hadoop.fs._
+import org.apache.hadoop.io._
+import org.apache.hadoop.io.compress.{CompressionCodec, GzipCodec}
+import org.apache.hadoop.mapred._
+import org.apache.hadoop.util.{Progressable, ReflectionUtils}
+
+object BufferedTextOutputFormat {
+  final val batchRows: Int = 256
+
+  final val batchBytes: Int = 1 << 19
+}
+
+class BufferedTextOutputFormat extends FileOutputFormat[NullWritable, Text] {
+
+  import BufferedTextOutputFormat._
+
+  class BufferedTextRecordWriter(out: DataOutputStream) extends RecordWriter[NullWritable, Text] {
+    private val batch = new ArrayBuilder[Byte](batchBytes)
+    private var nBatched = 0
+
+    private def flushBatch() {
+      out.write(batch.underlying(), 0, batch.length)
+      batch.clear()
+      nBatched = 0
+    }
+
+    def write(key: NullWritable, value: Text) {
+      if (value != null) {
+        batch ++= (value.getBytes, value.getLength)
+        batch += '\n'.toByte
+        nBatched += 1
+        if (nBatched >= batchRows || batch.length >= batchBytes)
+          flushBatch()
+      }
+    }
+
+    def close(reporter: Reporter) {
+      flushBatch()
+      out.close()
+    }
+  }
+
+  override def getRecordWriter(ignored: FileSystem, job: JobConf,
+    name: String, progress: Progressable): RecordWriter[NullWritable, Text] = {
+    val codec: Option[CompressionCodec] =
+      if (FileOutputFormat.getCompressOutput(job)) {
+        val codecClass = FileOutputFormat.getOutputCompressorClass(job, classOf[GzipCodec])
+        Some(ReflectionUtils.newInstance(codecClass, job))
+      } else
+        None
+
+    val file: Path = FileOutputFormat.getTaskOutputPath(job, name + codec.map(_.getDefaultExtension).getOrElse(""))
+    val fs: FileSystem = file.getFileSystem(job)
+    val fileOut: OutputStream = new BufferedOutputStream(fs.create(file, progress), outputBufferSize)
+
+    // the codec stream batches into compressed blocks, but per-line writes still cross into it, so buffer both sides
+    val os = codec match {
+      case Some(c) => new BufferedOutputStream(c.createOutputStream(fileOut), outputBufferSize)
+      case None => fileOut
+    }
+    new BufferedTextRecordWriter(new DataOutputStream(os))
+  }
+}
@@ -1,7 +1,8 @@
 package is.hail.io.hadoop
 
-import java.io.DataOutputStream
+import java.io.{BufferedOutputStream, DataOutputStream}
 
+import is.hail.utils._
 import org.apache.hadoop.fs._
 import org.apache.hadoop.io._
 import org.apache.hadoop.mapred._
@@ -26,7 +27,6 @@ class ByteArrayOutputFormat extends FileOutputFormat[NullWritable, BytesOnlyWrit
     val file: Path = FileOutputFormat.getTaskOutputPath(job, name)
     val fs: FileSystem = file.getFileSystem(job)
     val fileOut: FSDataOutputStream = fs.create(file, progress)
-    new ByteArrayRecordWriter(fileOut)
+    new ByteArrayRecordWriter(new DataOutputStream(new BufferedOutputStream(fileOut, outputBufferSize)))
   }
 }
-
@@ -1,5 +1,7 @@
 package is.hail.io.plink
 
+import java.nio.{ByteBuffer, ByteOrder}
+
 import is.hail.utils._
 import is.hail.expr.types._
 import is.hail.annotations._
@@ -11,29 +13,34 @@ object ExportBedBimFam {
 
   def bedRowTransformer(nSamples: Int, rowType: TStruct): Iterator[RegionValue] => Iterator[Array[Byte]] = { it =>
     val hcv = HardCallView(rowType)
-    val rv2 = RegionValue()
-    val gtMap = Array(3, 2, 0)
     val nBytes = (nSamples + 3) / 4
     val a = new Array[Byte](nBytes)
+    val bb = ByteBuffer.wrap(a).order(ByteOrder.LITTLE_ENDIAN)
 
     it.map { rv =>
       hcv.setRegion(rv)
 
-      var b = 0
+      // pack 32 2-bit codes per word; the first sample goes in the low bits of the first byte
+      var w = 0L
       var k = 0
       while (k < nSamples) {
         hcv.setGenotype(k)
         val gt = if (hcv.hasGT) gtMap(Call.unphasedDiploidGtIndex(hcv.getGT)) else 1
 
-        b |= gt << ((k & 3) * 2)
-        if ((k & 3) == 3) {
-          a(k >> 2) = b.toByte
-          b = 0
+        w |= gt.toLong << ((k & 31) << 1)
+        if ((k & 31) == 31) {
+          bb.putLong((k >> 2) - 7, w)
+          w = 0L
         }
         k += 1
       }
-      if ((k & 3) > 0)
-        a(nBytes - 1) = b.toByte
+
+      var i = (nSamples >> 5) << 3
+      while (i < nBytes) {
+        a(i) = w.toByte
+        w >>>= 8
+        i += 1
+      }
 
       // FIXME: NO BYTE ARRAYS, go directly through writePartitions
       a
@@ -1,5 +1,7 @@
 package is.hail.io.plink
 
+import java.util.regex.Pattern
+
 import is.hail.HailContext
 import is.hail.annotations._
 import is.hail.expr.types._
@@ -22,10 +24,12 @@ case class FamFileConfig(isQuantPheno: Boolean = false,
 object LoadPlink {
   def expectedBedSize(nSamples: Int, nVariants: Long): Long = 3 + nVariants * ((nSamples + 3) / 4)
 
+  private val whitespace = Pattern.compile("\\s+")
+
   private def parseBim(bimPath: String, hConf: Configuration, a2Reference: Boolean = true,
     contigRecoding: Map[String, String] = Map.empty[String, String]): Array[(String, Int, String, String, String)] = {
     hConf.readLines(bimPath)(_.map(_.map { line =>
-      line.split("\\s+") match {
+      whitespace.split(line) match {
         case Array(contig, rsId, morganPos, bpPos, allele1, allele2) =>
           val recodedContig = contigRecoding.getOrElse(contig, contig)
           if (a2Reference)
@@ -46,6 +50,7 @@ object LoadPlink {
     hConf: hadoop.conf.Configuration): (IndexedSeq[Row], TStruct) = {
 
     val delimiter = unescapeString(ffConfig.delimiter)
+    val delimiterPattern = Pattern.compile(delimiter)
 
     val phenoSig = if (ffConfig.isQuantPheno) ("quant_pheno", TFloat64()) else ("is_case", TBoolean())
 
@@ -58,7 +63,7 @@ object LoadPlink {
     val m = hConf.readLines(filename) {
       _.foreachLine { line =>
 
-        val split = line.split(delimiter)
+        val split = delimiterPattern.split(line)
         if (split.length != 6)
           fatal(s"expected 6 fields, but found ${ split.length }")
         val Array(fam, kid, dad, mom, isFemale, pheno) = split
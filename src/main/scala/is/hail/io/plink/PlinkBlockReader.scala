@@ -1,32 +1,48 @@
 package is.hail.io.plink
 
+import java.io.{File, RandomAccessFile}
+import java.nio.MappedByteBuffer
+import java.nio.channels.FileChannel
+
 import is.hail.annotations.RegionValueBuilder
 import is.hail.io.{IndexedBinaryBlockReader, KeySerializedValueRecord}
-import is.hail.variant.{Call, Call2}
+import is.hail.variant.Call2
 import org.apache.hadoop.conf.Configuration
 import org.apache.hadoop.io.LongWritable
 import org.apache.hadoop.mapred.FileSplit
 
-import scala.annotation.switch
+object PlinkRecord {
+  // call for each 2-bit BED code; -1 marks missing (code 1)
+  val a2ReferenceCalls: Array[Int] = Array(
+    Call2.fromUnphasedDiploidGtIndex(2), -1, Call2.fromUnphasedDiploidGtIndex(1), Call2.fromUnphasedDiploidGtIndex(0))
+
+  val a1ReferenceCalls: Array[Int] = Array(
+    Call2.fromUnphasedDiploidGtIndex(0), -1, Call2.fromUnphasedDiploidGtIndex(1), Call2.fromUnphasedDiploidGtIndex(2))
+}
 
 class PlinkRecord(nSamples: Int, a2Reference: Boolean) extends KeySerializedValueRecord[Int] {
+  private val calls = if (a2Reference) PlinkRecord.a2ReferenceCalls else PlinkRecord.a1ReferenceCalls
+
   override def getValue(rvb: RegionValueBuilder) {
     require(input != null, "called getValue before serialized value was set")
 
-    val c = if (a2Reference) 0 else 3
     rvb.startArray(nSamples)
     var i = 0
+    // decode the four genotypes of each byte from a single load
     while (i < nSamples) {
-      rvb.startStruct() // g
-      val x = (input(i >> 2) >> ((i & 3) << 1)) & 3
-      (x: @switch @unchecked) match {
-        case 0 => rvb.addInt(if (a2Reference) Call2.fromUnphasedDiploidGtIndex(2) else Call2.fromUnphasedDiploidGtIndex(0))
-        case 1 => rvb.setMissing()
-        case 2 => rvb.addInt(Call2.fromUnphasedDiploidGtIndex(1))
-        case 3 => rvb.addInt(if (a2Reference) Call2.fromUnphasedDiploidGtIndex(0) else Call2.fromUnphasedDiploidGtIndex(2))
+      var b = input(i >> 2) & 0xff
+      val end = math.min(i + 4, nSamples)
+      while (i < end) {
+        val c = calls(b & 3)
+        rvb.startStruct() // g
+        if (c == -1)
+          rvb.setMissing()
+        else
+          rvb.addInt(c)
+        rvb.endStruct() // g
+        b >>= 2
+        i += 1
       }
-      rvb.endStruct() // g
-      i += 1
     }
     rvb.endArray()
   }
@@ -40,6 +56,30 @@ class PlinkBlockReader(job: Configuration, split: FileSplit) extends IndexedBina
 
   seekToFirstBlockInSplit(split.getStart)
 
+  // records are consumed before the next one is read, so one buffer serves the whole split
+  private val input = new Array[Byte](blockLength)
+
+  // BED files on the local file system are memory-mapped from the first block in the split through the end of
+  // the last one, so each variant is a copy out of the page cache rather than a read through the Hadoop stream
+  private val mappedStart = pos
+  private val mapped: MappedByteBuffer = {
+    val file = split.getPath
+    if (file.toUri.getScheme == "file" && pos < end) {
+      val f = new File(file.toUri)
+      val mapLength = math.min(end - pos + blockLength, f.length() - pos)
+      if (mapLength <= Int.MaxValue) {
+        val raf = new RandomAccessFile(f, "r")
+        try {
+          raf.getChannel.map(FileChannel.MapMode.READ_ONLY, pos, mapLength)
+        } finally {
+          raf.close()
+        }
+      } else
+        null
+    } else
+      null
+  }
+
   override def createValue(): PlinkRecord = new PlinkRecord(nSamples, a2Reference)
 
   def seekToFirstBlockInSplit(start: Long) {
@@ -60,7 +100,12 @@ class PlinkBlockReader(job: Configuration, split: FileSplit) extends IndexedBina
     if (pos >= end)
       false
     else {
-      value.setSerializedValue(bfis.readBytes(blockLength))
+      if (mapped != null) {
+        mapped.position((pos - mappedStart).toInt)
+        mapped.get(input)
+      } else
+        bfis.readBytes(input, 0, blockLength)
+      value.setSerializedValue(input)
 
       assert(variantIndex >= 0 && variantIndex <= Integer.MAX_VALUE)
       value.setKey(variantIndex.toInt)
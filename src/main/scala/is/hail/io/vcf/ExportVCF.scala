@@ -33,13 +33,13 @@ object ExportVCF {
         if (x.isNaN)
           sb += '.'
         else
-          sb.append(x.formatted("%.5e"))
+          sb.appendScientific(x.toDouble)
       case TFloat64(_) =>
         val x = m.loadDouble(offset)
         if (x.isNaN)
           sb += '.'
         else
-          sb.append(x.formatted("%.5e"))
+          sb.appendScientific(x)
       case TString(_) =>
         sb.append(TString.loadString(m, offset))
       case TCall(_) =>
@@ -164,27 +164,37 @@ object ExportVCF {
     }
   }
   
-  def emitGenotype(sb: StringBuilder, formatFieldOrder: Array[Int], tg: TStruct, m: Region, offset: Long) {
-    formatFieldOrder.foreachBetween { j =>
+  def emitGenotype(sb: StringBuilder, formatFieldOrder: Array[Int], formatFieldTypes: Array[Type], tg: TStruct,
+    m: Region, offset: Long) {
+    var i = 0
+    while (i < formatFieldOrder.length) {
+      if (i > 0)
+        sb += ':'
+
+      val j = formatFieldOrder(i)
       val fIsDefined = tg.isFieldDefined(m, offset, j)
-      val fOffset = tg.loadField(m, offset, j)
 
-      tg.fields(j).typ match {
+      formatFieldTypes(i) match {
         case it: TIterable =>
           if (fIsDefined) {
+            val fOffset = tg.loadField(m, offset, j)
             val fLength = it.loadLength(m, fOffset)
             iterableVCF(sb, it, m, fLength, fOffset)
           } else
             sb += '.'
-        case t =>
+        case _: TCall =>
           if (fIsDefined)
-            strVCF(sb, t, m, fOffset)
-          else if (t.isOfType(TCall()))
+            Call.vcfString(m.loadInt(tg.loadField(m, offset, j)), sb)
+          else
             sb.append("./.")
+        case t =>
+          if (fIsDefined)
+            strVCF(sb, t, m, tg.loadField(m, offset, j))
           else
             sb += '.'
       }
-    }(sb += ':')
+      i += 1
+    }
   }
 
   def getAttributes(k1: String, attributes: Option[VCFMetadata]): Option[VCFAttributes] =
@@ -215,6 +225,9 @@ object ExportVCF {
       case None => tg.fields.indices.toArray
     }
     val formatFieldString = formatFieldOrder.map(i => tg.fields(i).name).mkString(":")
+    val formatFieldTypes: Array[Type] = formatFieldOrder.map(i => tg.types(i))
+    // entries imported from a VCF with only GT skip the per-field dispatch in emitGenotype
+    val gtOnly = tg.size == 1 && tg.fields(0).name == "GT" && tg.types(0).isInstanceOf[TCall]
 
     val tinfo =
       if (vsm.rowType.hasField("info")) {
@@ -362,10 +375,16 @@ object ExportVCF {
           sb += '.'
   
         sb += '\t'
-        sb.append(rvv.alleles()(0))
+        val alleles = rvv.alleles()
+        sb.append(alleles(0))
         sb += '\t'
-        rvv.alleles().tail.foreachBetween(aa =>
-          sb.append(aa))(sb += ',')
+        var a = 1
+        while (a < alleles.length) {
+          if (a > 1)
+            sb += ','
+          sb.append(alleles(a))
+          a += 1
+        }
         sb += '\t'
 
         if (qualExists && fullRowType.isFieldDefined(rv, qualIdx)) {
@@ -410,14 +429,30 @@ object ExportVCF {
 
           val gsOffset = fullRowType.loadField(rv, localEntriesIndex)
           var i = 0
-          while (i < localNSamples) {
-            sb += '\t'
-            if (localEntriesType.isElementDefined(m, gsOffset, i))
-              emitGenotype(sb, formatFieldOrder, tg, m, localEntriesType.loadElement(m, gsOffset, localNSamples, i))
-            else
-              sb.append("./.")
-
-            i += 1
+          if (gtOnly) {
+            while (i < localNSamples) {
+              sb += '\t'
+              if (localEntriesType.isElementDefined(m, gsOffset, i)) {
+                val gOffset = localEntriesType.loadElement(m, gsOffset, localNSamples, i)
+                if (tg.isFieldDefined(m, gOffset, 0))
+                  Call.vcfString(m.loadInt(tg.loadField(m, gOffset, 0)), sb)
+                else
+                  sb.append("./.")
+              } else
+                sb.append("./.")
+
+              i += 1
+            }
+          } else {
+            while (i < localNSamples) {
+              sb += '\t'
+              if (localEntriesType.isElementDefined(m, gsOffset, i))
+                emitGenotype(sb, formatFieldOrder, formatFieldTypes, tg, m, localEntriesType.loadElement(m, gsOffset, localNSamples, i))
+              else
+                sb.append("./.")
+
+              i += 1
+            }
           }
         }
         
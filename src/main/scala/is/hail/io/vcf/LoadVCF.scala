@@ -1,5 +1,8 @@
 package is.hail.io.vcf
 
+import java.io.{BufferedReader, InputStreamReader}
+import java.nio.charset.StandardCharsets
+
 import htsjdk.variant.vcf._
 import is.hail.HailContext
 import is.hail.annotations._
@@ -17,7 +20,6 @@ import scala.annotation.switch
 import scala.collection.JavaConversions._
 import scala.language.implicitConversions
 import scala.collection.mutable
-import scala.io.Source
 
 case class VCFHeaderInfo(sampleIds: Array[String], infoSignature: TStruct, vaSignature: TStruct, genotypeSignature: TStruct,
   filtersAttrs: VCFAttributes, infoAttrs: VCFAttributes, formatAttrs: VCFAttributes)
@@ -683,11 +685,18 @@ object LoadVCF {
     VCFHeaderInfo(sampleIds, infoSignature, vaSignature, gSignature, filterAttrs, infoAttrs, formatAttrs)
   }
 
+  private val headerBufferSize = 1 << 16
+
+  // reads (and, for block-compressed files, decompresses) only up to the first data line
   def getHeaderLines[T](hConf: Configuration, file: String): Array[String] = hConf.readFile(file) { s =>
-    Source.fromInputStream(s)
-      .getLines()
-      .takeWhile { line => line(0) == '#' }
-      .toArray
+    val reader = new BufferedReader(new InputStreamReader(s, StandardCharsets.UTF_8), headerBufferSize)
+    val ab = new ArrayBuilder[String]()
+    var line = reader.readLine()
+    while (line != null && line(0) == '#') {
+      ab += line
+      line = reader.readLine()
+    }
+    ab.result()
   }
 
   // parses the Variant (key), leaves the rest to f
@@ -92,16 +92,19 @@ object Table {
     new Table(hc, TableParallelize(typ, rows, nPartitions))
   }
 
-  def importIntervalList(hc: HailContext, filename: String,
-    rg: Option[ReferenceGenome] = Some(ReferenceGenome.defaultReference)): Table = {
+  def importIntervalList(hc: HailContext, filename: String, rg: Option[ReferenceGenome]): Table = {
     IntervalList.read(hc, filename, rg)
   }
 
-  def importBED(hc: HailContext, filename: String,
-    rg: Option[ReferenceGenome] = Some(ReferenceGenome.defaultReference)): Table = {
+  // no reference genome; spares Python building a scala.None over Py4J
+  def importIntervalList(hc: HailContext, filename: String): Table = importIntervalList(hc, filename, None)
+
+  def importBED(hc: HailContext, filename: String, rg: Option[ReferenceGenome]): Table = {
     BedAnnotator.apply(hc, filename, rg)
   }
 
+  def importBED(hc: HailContext, filename: String): Table = importBED(hc, filename, None)
+
   def importFam(hc: HailContext, path: String, isQuantPheno: Boolean = false,
     delimiter: String = "\\t",
     missingValue: String = "NA"): Table = {
@@ -5,6 +5,8 @@ import java.io.{InputStream, OutputStream}
 import is.hail.HailContext
 import is.hail.table.Table
 import is.hail.variant.MatrixTable
+import org.json4s.Formats
+import org.json4s.jackson.JsonMethods
 
 import scala.collection.JavaConverters._
 
@@ -26,10 +28,18 @@ trait Py4jUtils {
   // we cannot construct an array because we don't have the class tag
   def arrayListToISeq[T](al: java.util.ArrayList[T]): IndexedSeq[T] = al.asScala.toIndexedSeq
 
+  // one gateway call for the common single-path argument, instead of building an ArrayList element by element
+  def stringToISeq(s: String): IndexedSeq[String] = IndexedSeq(s)
+
   def arrayListToSet[T](al: java.util.ArrayList[T]): Set[T] = al.asScala.toSet
 
   def javaMapToMap[K, V](jm: java.util.Map[K, V]): Map[K, V] = jm.asScala.toMap
 
+  def parseStringMapJSON(s: String): Map[String, String] = {
+    implicit val formats: Formats = defaultJSONFormats
+    JsonMethods.parse(s).extract[Map[String, String]]
+  }
+
   def makeIndexedSeq[T](arr: Array[T]): IndexedSeq[T] = arr: IndexedSeq[T]
 
   def makeInt(i: Int): Int = i
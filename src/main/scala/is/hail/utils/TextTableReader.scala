@@ -1,5 +1,6 @@
 package is.hail.utils
 
+import java.util.concurrent.ConcurrentHashMap
 import java.util.regex.Pattern
 
 import is.hail.annotations.Annotation
@@ -14,6 +15,67 @@ import org.apache.spark.sql.Row
 object TextTableReader {
 
   def splitLine(s: String, separator: String, quote: java.lang.Character): Array[String] = {
+    if (separator.length == 1 && quote == null)
+      splitLine(s, separator(0))
+    else if (separator == "\\s+" && quote == null)
+      splitWhitespace(s)
+    else
+      splitQuotedLine(s, separator, quote)
+  }
+
+  // the characters matched by \s in java.util.regex
+  private def isWhitespace(c: Char): Boolean =
+    c == ' ' || c == '\t' || c == '\n' || c == '\u000b' || c == '\f' || c == '\r'
+
+  // same fields as splitting on the regex \s+ below, without a regex match attempt at every character
+  def splitWhitespace(s: String): Array[String] = {
+    val ab = new ArrayBuilder[String]
+    var start = 0
+    var i = 0
+    while (i < s.length) {
+      if (isWhitespace(s(i))) {
+        ab += s.substring(start, i)
+        i += 1
+        while (i < s.length && isWhitespace(s(i)))
+          i += 1
+        start = i
+      } else
+        i += 1
+    }
+    ab += s.substring(start)
+
+    ab.result()
+  }
+
+  private val separatorPatterns = new ConcurrentHashMap[String, Pattern]()
+
+  // splitQuotedLine runs once per line, so don't recompile the separator each time
+  private def separatorPattern(separator: String): Pattern = {
+    var p = separatorPatterns.get(separator)
+    if (p == null) {
+      p = Pattern.compile(separator)
+      separatorPatterns.put(separator, p)
+    }
+    p
+  }
+
+  // String.indexOf(Char) is a JIT intrinsic that compares many characters per instruction, so unquoted
+  // single-character separators skip the per-character loop and StringBuilder copy below
+  def splitLine(s: String, separator: Char): Array[String] = {
+    val ab = new ArrayBuilder[String]
+    var start = 0
+    var end = s.indexOf(separator)
+    while (end >= 0) {
+      ab += s.substring(start, end)
+      start = end + 1
+      end = s.indexOf(separator, start)
+    }
+    ab += s.substring(start)
+
+    ab.result()
+  }
+
+  private def splitQuotedLine(s: String, separator: String, quote: java.lang.Character): Array[String] = {
 
     val matchSep: Int => Int = separator.length match {
       case 0 => fatal("Hail does not currently support 0-character separators")
@@ -21,8 +83,7 @@ object TextTableReader {
         val sepChar = separator(0)
         (i: Int) => if (s(i) == sepChar) 1 else -1
       case _ =>
-        val p = Pattern.compile(separator)
-        val m = p.matcher(s)
+        val m = separatorPattern(separator).matcher(s)
 
       { (i: Int) =>
         m.region(i, s.length)
@@ -220,6 +281,7 @@ object TextTableReader {
     info(sb.result())
 
     val schema = TStruct(namesAndTypes: _*)
+    val importers = namesAndTypes.map { case (_, t) => TableAnnotationImpex.importer(t) }
 
     val parsed = rdd
       .map {
@@ -232,15 +294,15 @@ object TextTableReader {
 
           var i = 0
           while (i < nField) {
-            val (name, t) = namesAndTypes(i)
             val field = split(i)
             try {
               if (field == missing)
                 a(i) = null
               else
-                a(i) = TableAnnotationImpex.importAnnotation(field, t)
+                a(i) = importers(i)(field)
             } catch {
               case e: Exception =>
+                val (name, t) = namesAndTypes(i)
                 fatal(s"""${ e.getClass.getName }: could not convert "$field" to $t in column "$name" """)
             }
             i += 1
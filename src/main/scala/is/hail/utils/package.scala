@@ -88,6 +88,10 @@ package object utils extends Logging
   final val msPerHour = 60 * msPerMinute
   final val msPerDay = 24 * msPerHour
 
+  final val outputBufferSize = 1 << 18
+
+  final val inputBufferSize = 1 << 18
+
   def formatTime(dt: Long): String = {
     val tMilliseconds = dt / 1e6
     if (tMilliseconds < 1000)
@@ -21,7 +21,7 @@ class RichHadoopConfiguration(val hConf: hadoop.conf.Configuration) extends AnyV
   private def create(filename: String): OutputStream = {
     val fs = fileSystem(filename)
     val hPath = new hadoop.fs.Path(filename)
-    val os = fs.create(hPath)
+    val os = new BufferedOutputStream(fs.create(hPath), outputBufferSize)
     val codecFactory = new CompressionCodecFactory(hConf)
     val codec = codecFactory.getCodec(hPath)
 
@@ -34,7 +34,7 @@ class RichHadoopConfiguration(val hConf: hadoop.conf.Configuration) extends AnyV
   private def open(filename: String): InputStream = {
     val fs = fileSystem(filename)
     val hPath = new hadoop.fs.Path(filename)
-    val is = fs.open(hPath)
+    val is = fs.open(hPath, inputBufferSize)
     val codecFactory = new CompressionCodecFactory(hConf)
     val codec = codecFactory.getCodec(hPath)
     if (codec != null)
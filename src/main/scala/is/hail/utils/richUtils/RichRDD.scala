@@ -2,10 +2,12 @@ package is.hail.utils.richUtils
 
 import java.io.OutputStream
 
+import is.hail.io.hadoop.BufferedTextOutputFormat
 import is.hail.sparkextras.ReorderedPartitionsRDD
 import is.hail.utils._
 import org.apache.commons.lang3.StringUtils
 import org.apache.hadoop
+import org.apache.hadoop.io.{NullWritable, Text}
 import org.apache.hadoop.io.compress.CompressionCodecFactory
 import org.apache.spark.{NarrowDependency, Partition, TaskContext}
 import org.apache.spark.rdd.RDD
@@ -62,9 +64,18 @@ class RichRDD[T](val r: RDD[T]) extends AnyVal {
       }
     }.getOrElse(r)
 
+    val rText = rWithHeader.mapPartitions { it =>
+      val text = new Text()
+      it.map { x =>
+        text.set(x.toString)
+        (NullWritable.get(), text)
+      }
+    }
+
     codec match {
-      case Some(x) => rWithHeader.saveAsTextFile(parallelOutputPath, x.getClass)
-      case None => rWithHeader.saveAsTextFile(parallelOutputPath)
+      case Some(x) => rText.saveAsHadoopFile(parallelOutputPath, classOf[NullWritable], classOf[Text],
+        classOf[BufferedTextOutputFormat], x.getClass)
+      case None => rText.saveAsHadoopFile[BufferedTextOutputFormat](parallelOutputPath)
     }
 
     if (exportType == ExportType.PARALLEL_SEPARATE_HEADER) {
@@ -3,11 +3,184 @@ package is.hail.utils.richUtils
 import scala.collection.mutable
 
 class RichStringBuilder(val sb: mutable.StringBuilder) extends AnyVal {
+  /**
+    * Appends the same characters as {@code sb.append(d.formatted(s"%.${ precision }e"))}, rounding the shortest
+    * decimal representation of {@code d} half-up as java.util.Formatter does, without the cost of parsing a format
+    * string and allocating a Formatter per value.
+    */
+  def appendScientific(d: Double, precision: Int = 5) {
+    require(precision >= 0)
+
+    if (!appendNonFinite(d)) {
+      val digits = newDigits()
+      var exp = 0
+      val x = math.abs(d)
+      if (x != 0) {
+        exp = shortestDigits(x, digits)
+        if (roundDigits(digits, precision + 1))
+          exp += 1
+      }
+
+      sb += digits(0)
+      if (precision > 0) {
+        sb += '.'
+        var i = 1
+        while (i <= precision) {
+          sb += digitAt(digits, i)
+          i += 1
+        }
+      }
+      sb += 'e'
+      if (exp < 0) {
+        sb += '-'
+        exp = -exp
+      } else
+        sb += '+'
+      if (exp < 10)
+        sb += '0'
+      sb.append(exp)
+    }
+  }
+
+  /**
+    * Appends the same characters as {@code sb.append(d.formatted(s"%.${ precision }f"))}. See {@code appendScientific}.
+    */
+  def appendFixed(d: Double, precision: Int) {
+    require(precision >= 0)
+
+    if (!appendNonFinite(d)) {
+      val digits = newDigits()
+      // digits(i) has weight 10^(exp - i)
+      var exp = -1
+      val x = math.abs(d)
+      if (x != 0) {
+        exp = shortestDigits(x, digits)
+        // keep < 0 means x rounds to zero; every emitted index below is then negative
+        val keep = exp + 1 + precision
+        if (keep >= 0 && roundDigits(digits, keep))
+          exp += 1
+      }
+
+      if (exp < 0)
+        sb += '0'
+      else {
+        var i = 0
+        while (i <= exp) {
+          sb += digitAt(digits, i)
+          i += 1
+        }
+      }
+      if (precision > 0) {
+        sb += '.'
+        var j = 1
+        while (j <= precision) {
+          val i = exp + j
+          sb += (if (i < 0) '0' else digitAt(digits, i))
+          j += 1
+        }
+      }
+    }
+  }
+
+  private def appendNonFinite(d: Double): Boolean = {
+    if (d.isNaN) {
+      sb.append("NaN")
+      true
+    } else {
+      if (java.lang.Double.doubleToRawLongBits(d) < 0)
+        sb += '-'
+      if (d.isInfinity) {
+        sb.append("Infinity")
+        true
+      } else
+        false
+    }
+  }
+
+  // Double.toString never produces more than 17 significant digits
+  private def newDigits(): Array[Char] = Array.fill[Char](18)('0')
+
+  private def digitAt(digits: Array[Char], i: Int): Char = if (i < digits.length) digits(i) else '0'
+
+  /**
+    * Writes the significant digits of the shortest decimal representation of {@code x > 0} into {@code digits},
+    * which must be filled with '0', and returns the base-10 exponent of the first one.
+    */
+  private def shortestDigits(x: Double, digits: Array[Char]): Int = {
+    val s = java.lang.Double.toString(x)
+    val ePos = s.indexOf('E')
+    val mEnd = if (ePos < 0) s.length else ePos
+    val dotPos = s.indexOf('.')
+
+    // digit k of the mantissa (not counting the point) has weight 10^(dotPos - 1 - k)
+    var k = 0
+    var firstNonZero = -1
+    var nDigits = 0
+    var i = 0
+    while (i < mEnd) {
+      val c = s.charAt(i)
+      if (c != '.') {
+        if (firstNonZero < 0 && c != '0')
+          firstNonZero = k
+        if (firstNonZero >= 0) {
+          digits(nDigits) = c
+          nDigits += 1
+        }
+        k += 1
+      }
+      i += 1
+    }
+
+    var e10 = 0
+    if (ePos >= 0) {
+      val negative = s.charAt(ePos + 1) == '-'
+      i = if (negative) ePos + 2 else ePos + 1
+      while (i < s.length) {
+        e10 = e10 * 10 + (s.charAt(i) - '0')
+        i += 1
+      }
+      if (negative)
+        e10 = -e10
+    }
+
+    dotPos - 1 - firstNonZero + e10
+  }
+
+  /**
+    * Rounds {@code digits} half-up to its first {@code n} digits, zeroing the rest. Returns true if the carry
+    * propagated out of the first digit, in which case {@code digits} is 1 followed by zeros and the exponent must be
+    * incremented.
+    */
+  private def roundDigits(digits: Array[Char], n: Int): Boolean = {
+    val roundUp = n < digits.length && digits(n) >= '5'
+    var i = n
+    while (i < digits.length) {
+      digits(i) = '0'
+      i += 1
+    }
+
+    if (roundUp) {
+      var j = n - 1
+      while (j >= 0 && digits(j) == '9') {
+        digits(j) = '0'
+        j -= 1
+      }
+      if (j >= 0) {
+        digits(j) = (digits(j) + 1).toChar
+        false
+      } else {
+        digits(0) = '1'
+        true
+      }
+    } else
+      false
+  }
+
   def tsvAppend(a: Any) {
     a match {
       case null | None => sb.append("NA")
       case Some(x) => tsvAppend(x)
-      case d: Double => sb.append(d.formatted("%.5e"))
+      case d: Double => appendScientific(d)
       case i: Iterable[_] =>
         var first = true
         i.foreach { x =>
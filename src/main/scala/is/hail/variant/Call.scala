@@ -169,7 +169,27 @@ object Call extends Serializable {
     }
   }
 
+  // diploid calls on the first four alleles, indexed by their encoding
+  private val nCachedAlleleReprs: Int = 10
+
+  private val cachedVCFStrings: Array[String] = Array.tabulate(nCachedAlleleReprs << 3) { c =>
+    if (isDiploid(c)) {
+      val sb = new StringBuilder()
+      vcfStringUncached(c, sb)
+      sb.result()
+    } else
+      null
+  }
+
   def vcfString(c: Call, sb: StringBuilder): Unit = {
+    // ploidy == 2 and alleleRepr in the cached range, tested directly on the encoding
+    if ((c & 0x6) == 0x4 && (c >>> 3) < nCachedAlleleReprs)
+      sb.append(cachedVCFStrings(c))
+    else
+      vcfStringUncached(c, sb)
+  }
+
+  private def vcfStringUncached(c: Call, sb: StringBuilder): Unit = {
     val phased = isPhased(c)
     val sep = if (phased) "|" else "/"
 
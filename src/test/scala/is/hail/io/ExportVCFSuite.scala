@@ -253,6 +253,22 @@ class ExportVCFSuite extends SparkSuite {
     }
   }
 
+  @Test def testGTOnly() {
+    val vds = hc.importVCF("src/test/resources/sample.vcf").selectEntries("g.GT")
+
+    val out = tmpDir.createLocalTempFile("foo", "vcf")
+    ExportVCF(vds, out)
+    hadoopConf.readLines(out) { lines =>
+      lines.foreach { l =>
+        if (l.value.startsWith("20\t13029920")) {
+          assert(l.value.contains("\tGT\t1/1\t1/1\t1/1\t1/1\t1/1\t1/1\t1/1\t1/1\t1/1\t./.\t1/1"))
+        }
+      }
+    }
+
+    assert(hc.importVCF(out).same(vds))
+  }
+
   def genFormatFieldVCF: Gen[Type] = Gen.oneOf[Type](
     TInt32(), TFloat32(), TFloat64(), TString(), TCall(),
     TArray(TInt32()), TArray(TFloat32()), TArray(TFloat64()), TArray(TString()), TArray(TCall()),
@@ -1,6 +1,6 @@
 package is.hail.io
 
-import is.hail.SparkSuite
+import is.hail.{SparkSuite, TestUtils}
 import is.hail.check.Gen._
 import is.hail.check.Prop._
 import is.hail.check.{Gen, Properties}
@@ -224,6 +224,16 @@ class ImportBgenSuite extends SparkSuite {
     hc.importBgen(bgen, Option(sample), includeGT = true, includeGP = true, includeDosage = false).count()
   }
 
+  @Test def testMissingIndex() {
+    val bgen = tmpDir.createTempFile("noindex", "bgen")
+    hadoopConf.copy("src/test/resources/example.v11.bgen", bgen)
+
+    TestUtils.interceptFatal("have no index file") {
+      hc.importBgen(bgen, Some("src/test/resources/example.sample"),
+        includeGT = true, includeGP = true, includeDosage = false)
+    }
+  }
+
   @Test def testReIterate() {
     hc.indexBgen("src/test/resources/example.v11.bgen")
     val vds = hc.importBgen("src/test/resources/example.v11.bgen", Some("src/test/resources/example.sample"),
@@ -2,6 +2,7 @@ package is.hail.io
 
 import is.hail.SparkSuite
 import is.hail.annotations.Annotation
+import is.hail.io.gen.LoadGen
 import is.hail.utils._
 import is.hail.testUtils._
 import is.hail.variant._
@@ -24,6 +25,18 @@ class ImportGenSuite extends SparkSuite {
     }
   }
 
+  @Test def testParseGenProb() {
+    val values = Array("0", "1", "0.", "1.", ".5", "0.5", "0.9837", "1.000", "0.333333333333333", "0.1234567890123456",
+      "0.00000000000000001", "1e-3", "3.5E2", "-0.25", "+0.25", "12345678901234567890", "0.1", "0.7", "0.3")
+    values.foreach { s => assert(LoadGen.parseGenProb(s) == s.toDouble, s) }
+
+    val r = new scala.util.Random(0)
+    (0 until 1000).foreach { _ =>
+      val s = "0." + Array.fill(1 + r.nextInt(17))(r.nextInt(10)).mkString
+      assert(LoadGen.parseGenProb(s) == s.toDouble, s)
+    }
+  }
+
   @Test def testGavinExample() {
     val gen = "src/test/resources/example.gen"
     val sampleFile = "src/test/resources/example.sample"
@@ -70,4 +83,21 @@ class ImportGenSuite extends SparkSuite {
     }
     assert(res)
   }
+
+  @Test def testForceBGZ() {
+    val gen = "src/test/resources/example.gen"
+    val sampleFile = "src/test/resources/example.sample"
+    val contigRecoding = Some(Map("01" -> "1"))
+
+    val bgzFile = tmpDir.createTempFile("example", "gen.bgz")
+    hadoopConf.writeTextFile(bgzFile) { out =>
+      hadoopConf.readLines(gen)(_.foreach(line => out.write(line.value + "\n")))
+    }
+    val gzFile = tmpDir.createTempFile("example", "gen.gz")
+    hadoopConf.copy(bgzFile, gzFile)
+
+    val expected = hc.importGen(gen, sampleFile, contigRecoding = contigRecoding)
+    val actual = hc.importGen(gzFile, sampleFile, contigRecoding = contigRecoding, forceBGZ = true)
+    assert(actual.same(expected))
+  }
 }
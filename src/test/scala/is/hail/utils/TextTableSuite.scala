@@ -87,4 +87,16 @@ class TextTableSuite extends SparkSuite {
   @Test def testPipeDelimiter() {
     assert(TextTableReader.splitLine("a|b", "|", '#').toSeq == Seq("a", "b"))
   }
+
+  @Test def testSplitUnquoted() {
+    assert(TextTableReader.splitLine("", "\t", null).toSeq == Seq(""))
+    assert(TextTableReader.splitLine("a\t\tb\t", "\t", null).toSeq == Seq("a", "", "b", ""))
+    assert(TextTableReader.splitLine("a|\"b\"", "|", null).toSeq == Seq("a", "\"b\""))
+    assert(TextTableReader.splitLine("a,,b", ",", null).toSeq == TextTableReader.splitLine("a,,b", ",", '"').toSeq)
+  }
+
+  @Test def testSplitWhitespace() {
+    for (s <- Array("", " ", "a", "a b", "a \t b", " a b", "a b ", "\ta\r\nb\u000bc\fd"))
+      assert(TextTableReader.splitLine(s, "\\s+", null).toSeq == TextTableReader.splitLine(s, "\\s+", '"').toSeq, s)
+  }
 }
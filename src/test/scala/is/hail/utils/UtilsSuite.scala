@@ -207,4 +207,35 @@ class UtilsSuite extends SparkSuite {
     assert(c4.toSeq == Seq("a", "b", "c", "aD", "aDD", "cD", "aDDD"))
     assert(diff2.toSeq == Seq("a" -> "aD", "a" -> "aDD", "c" -> "cD", "a" -> "aDDD"))
   }
+
+  @Test def testAppendScientific() {
+    def check(d: Double) {
+      val sb = new StringBuilder()
+      sb.appendScientific(d)
+      assert(sb.result() == d.formatted("%.5e"), s"$d")
+    }
+
+    Array(0.0, -0.0, 1.0, -1.0, 0.5, 9.999995e-5, 9.999994999e-5, 1.2345650, 999999.5, 1e-5, 1e100, -1e-100,
+      Double.MinPositiveValue, Double.MaxValue, Double.PositiveInfinity, Double.NegativeInfinity, Double.NaN)
+      .foreach(check)
+
+    Prop.forAll(arbitrary[Double]) { d => check(d); true }.check()
+    Prop.forAll(arbitrary[Float]) { f => check(f.toDouble); true }.check()
+  }
+
+  @Test def testAppendFixed() {
+    def check(d: Double, precision: Int) {
+      val sb = new StringBuilder()
+      sb.appendFixed(d, precision)
+      assert(sb.result() == formatDouble(d, precision), s"$d $precision")
+    }
+
+    for (d <- Array(0.0, -0.0, 1.0, -1.0, 0.5, 0.99995, 0.00005, 0.00004999, -0.00001, 1e20, 1e-300,
+      Double.MaxValue, Double.PositiveInfinity, Double.NegativeInfinity, Double.NaN);
+      precision <- 0 to 6)
+      check(d, precision)
+
+    Prop.forAll(arbitrary[Double], Gen.choose(0, 10)) { (d, precision) => check(d, precision); true }.check()
+    Prop.forAll(Gen.choose(0.0, 1.0), Gen.choose(0, 10)) { (d, precision) => check(d, precision); true }.check()
+  }
 }
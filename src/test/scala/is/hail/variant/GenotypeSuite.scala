@@ -120,4 +120,26 @@ class GenotypeSuite extends TestNGSuite {
     intercept[UnsupportedOperationException](Call.parse("1|1|1"))
     TestUtils.interceptFatal("invalid call expression:")(Call.parse("0/"))
   }
+
+  @Test def testVCFString() {
+    def vcfString(c: Call): String = {
+      val sb = new StringBuilder()
+      Call.vcfString(c, sb)
+      sb.result()
+    }
+
+    assert(vcfString(Call2(0, 0)) == "0/0")
+    assert(vcfString(Call2(1, 0)) == "0/1")
+    assert(vcfString(Call2(1, 1)) == "1/1")
+    assert(vcfString(Call2(0, 1, phased = true)) == "0|1")
+    assert(vcfString(Call2(1, 0, phased = true)) == "1|0")
+    assert(vcfString(Call2(2, 3, phased = true)) == "2|3")
+    assert(vcfString(Call2(3, 3)) == "3/3")
+    assert(vcfString(Call2(4, 12)) == "4/12")
+    assert(vcfString(Call1(2)) == "2")
+
+    forAll(Call.gen(nAlleles = 20, ploidyGen = Gen.const(2))) { c =>
+      vcfString(c) == Call.toString(c)
+    }.check()
+  }
 }